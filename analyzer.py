@@ -1,20 +1,156 @@
 import io
 import re
+import string
+import threading
+import functools
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from wordcloud import WordCloud
+from collections import Counter
+from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import logging
-from config import DATA_DIR
+from config import DATA_DIR, SENTIMENT_WORKERS, PARALLEL_SENTIMENT_MIN_REVIEWS, PLOT_WORKERS, EXCEL_ENGINE_KWARGS
 
 logger = logging.getLogger(__name__)
 
+# Review date formats, in the order they are tried
+_DATE_FORMATS = ('%d %B %Y', '%B %d, %Y', '%Y-%m-%d', '%d/%m/%Y', '%d %b %Y')
+
+# Precompiled patterns for date and review text cleaning
+_PREFIX_RE = re.compile(r'Reviewed in \w+ on ')
+_URL_RE = re.compile(r'https?\S+|www\S+', re.MULTILINE)
+_EMAIL_RE = re.compile(r'\S+@\S+')
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+# Common English stopwords excluded from the word cloud
+_STOPWORDS = frozenset([
+    'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', "you're",
+    "you've", "you'll", "you'd", 'your', 'yours', 'yourself', 'yourselves', 'he',
+    'him', 'his', 'himself', 'she', "she's", 'her', 'hers', 'herself', 'it', "it's",
+    'its', 'itself', 'they', 'them', 'their', 'theirs', 'themselves', 'what', 'which',
+    'who', 'whom', 'this', 'that', "that'll", 'these', 'those', 'am', 'is', 'are',
+    'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'having', 'do',
+    'does', 'did', 'doing', 'a', 'an', 'the', 'and', 'but', 'if', 'or', 'because',
+    'as', 'until', 'while', 'of', 'at', 'by', 'for', 'with', 'about', 'against',
+    'between', 'into', 'through', 'during', 'before', 'after', 'above', 'below',
+    'to', 'from', 'up', 'down', 'in', 'out', 'on', 'off', 'over', 'under', 'again',
+    'further', 'then', 'once'
+])
+
+# Per-thread cache of reusable figures, keyed by figure size
+_FIGURE_CACHE = threading.local()
+
+# Sentiment categories, in code order, and their plot colors
+_SENTIMENT_CATEGORIES = ['Positive', 'Neutral', 'Negative']
+_SENTIMENT_COLORS = {'Positive': '#66cc66', 'Neutral': '#cccccc', 'Negative': '#ff6666'}
+
+# The plotting and NLP libraries below are imported where they are first
+# used, so importing this module (e.g. just to export or summarize) stays cheap
+
+@functools.lru_cache(maxsize=None)
+def _get_vader():
+    """Get the shared VADER analyzer, created on first use (once per process)."""
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+@functools.lru_cache(maxsize=None)
+def _get_stopwords():
+    """Get the word cloud stopwords: our list plus WordCloud's own."""
+    from wordcloud import STOPWORDS
+    return _STOPWORDS | STOPWORDS
+
+def _textblob_score(text):
+    """Calculate the TextBlob polarity score (-1 to 1) of a single text."""
+    if not text:
+        return 0.0
+    from textblob import TextBlob
+    try:
+        return TextBlob(str(text)).sentiment.polarity
+    except:
+        return 0.0
+
+def _vader_score(text, analyzer=None):
+    """Calculate the VADER compound score (-1 to 1) of a single text."""
+    # Empty reviews always score 0.0, no need to run the analyzer
+    if not text:
+        return 0.0
+    analyzer = analyzer or _get_vader()
+    try:
+        return analyzer.polarity_scores(str(text))['compound']
+    except:
+        return 0.0
+
+def _categorize_sentiment(scores, threshold):
+    """Bucket sentiment scores into Positive/Neutral/Negative categories.
+    
+    Args:
+        scores: Array of sentiment scores
+        threshold: Scores above +threshold are Positive, below -threshold Negative
+        
+    Returns:
+        pandas.Categorical: Sentiment category per score
+    """
+    scores = np.asarray(scores)
+    if scores.dtype.kind != 'f':
+        scores = scores.astype(float)
+    # Compare at the scores' own precision so float32 scores sitting exactly
+    # on a threshold stay Neutral
+    threshold = scores.dtype.type(threshold)
+    codes = np.select([scores > threshold, scores < -threshold], [0, 2], default=1)
+    return pd.Categorical.from_codes(codes, categories=_SENTIMENT_CATEGORIES)
+
+def _score_texts(texts, score_funcs):
+    """Score an array of texts with each of the given scoring functions.
+    
+    Each distinct text is scored once and the scores are broadcast back,
+    since short reviews ("Good", "Nice product") repeat a lot. Small batches
+    are scored in-process; larger ones are spread over a process pool since
+    sentiment scoring is CPU-bound.
+    
+    Args:
+        texts: Array of review texts
+        score_funcs: Module-level scoring functions to apply
+        
+    Returns:
+        list: One float32 array of scores per scoring function
+    """
+    codes, uniques = pd.factorize(texts, use_na_sentinel=False)
+    uniques = np.asarray(uniques, dtype=object)
+    count = len(uniques)
+    
+    if count < PARALLEL_SENTIMENT_MIN_REVIEWS or SENTIMENT_WORKERS < 2:
+        unique_scores = [np.fromiter((func(text) for text in uniques), dtype=np.float32, count=count)
+                         for func in score_funcs]
+    else:
+        chunksize = max(1, count // (SENTIMENT_WORKERS * 4))
+        with ProcessPoolExecutor(max_workers=SENTIMENT_WORKERS) as executor:
+            unique_scores = [np.fromiter(executor.map(func, uniques, chunksize=chunksize),
+                                         dtype=np.float32, count=count)
+                             for func in score_funcs]
+    
+    return [scores[codes] for scores in unique_scores]
+
+def render_plot_task(plot_name, method_name, plot_args, optional):
+    """Render one plot task, in a worker process or thread.
+    
+    Plot tasks carry their own pre-aggregated inputs, so the worker draws on
+    an empty analyzer and only those inputs are pickled, not the reviews.
+    Each call returns its own plots, so no plots dict is shared between threads.
+    
+    Args:
+        plot_name: Plot name used in log and error messages
+        method_name: Name of the ReviewAnalyzer method that draws the plot
+        plot_args: Arguments for that method
+        optional: Skip the error placeholder if the plot fails
+        
+    Returns:
+        tuple: (dict of plot name to PNG bytes, Plotly HTML or None)
+    """
+    analyzer = ReviewAnalyzer(pd.DataFrame())
+    analyzer.render_plot(plot_name, method_name, plot_args, optional)
+    return analyzer.plots, analyzer.plotly_sentiment_comparison_html
+
 class ReviewAnalyzer:
     def __init__(self, reviews_df, product_info=None):
         """Initialize the review analyzer.
@@ -32,10 +168,14 @@ class ReviewAnalyzer:
         else:
             self.product_info_df = None
         
-        self.vader = SentimentIntensityAnalyzer()
         self.plotly_sentiment_comparison_html = None
         self.plots = {}
     
+    @property
+    def vader(self):
+        """VADER sentiment analyzer, loaded on first use."""
+        return _get_vader()
+    
     def prepare_data(self):
         """Clean and prepare review data for analysis."""
         logger.info("Preparing data for analysis")
@@ -72,57 +212,64 @@ class ReviewAnalyzer:
         
         # Clean and convert date
         if 'date' in self.reviews_df.columns:
-            self.reviews_df['date'] = self.reviews_df['date'].apply(self.clean_date)
+            self.reviews_df['date'] = self.clean_dates(self.reviews_df['date'])
         
         # Convert star_rating to numeric
         self.reviews_df['star_rating'] = pd.to_numeric(self.reviews_df['star_rating'], errors='coerce')
         
         # Convert verified to boolean
-        self.reviews_df['verified'] = self.reviews_df['verified'].fillna(False)
+        self.reviews_df['verified'] = self.reviews_df['verified'].fillna(False).astype(bool)
         
         # Fill missing text with empty string
         self.reviews_df['text'] = self.reviews_df['text'].fillna('')
         
         # Calculate sentiments
         logger.info("Calculating sentiment scores")
-        self.reviews_df['textblob_sentiment'] = self.reviews_df['text'].apply(self.get_textblob_sentiment)
-        self.reviews_df['vader_sentiment'] = self.reviews_df['text'].apply(self.get_vader_sentiment)
+        textblob_scores, vader_scores = _score_texts(
+            self.reviews_df['text'].to_numpy(), (_textblob_score, _vader_score))
+        self.reviews_df['textblob_sentiment'] = textblob_scores
+        self.reviews_df['vader_sentiment'] = vader_scores
         
         # Categorize sentiments
-        self.reviews_df['textblob_category'] = self.reviews_df['textblob_sentiment'].apply(
-            lambda x: 'Positive' if x > 0.1 else ('Negative' if x < -0.1 else 'Neutral'))
-        self.reviews_df['vader_category'] = self.reviews_df['vader_sentiment'].apply(
-            lambda x: 'Positive' if x > 0.05 else ('Negative' if x < -0.05 else 'Neutral'))
+        self.reviews_df['textblob_category'] = _categorize_sentiment(
+            self.reviews_df['textblob_sentiment'].to_numpy(), 0.1)
+        self.reviews_df['vader_category'] = _categorize_sentiment(
+            self.reviews_df['vader_sentiment'].to_numpy(), 0.05)
+        
+        # Downcast to compact dtypes; nullable Int8 keeps missing ratings as NA
+        self.reviews_df = self.reviews_df.astype({
+            'star_rating': 'Int8',
+            'textblob_sentiment': 'float32',
+            'vader_sentiment': 'float32'
+        })
+        
+        # Stats cached from earlier data would no longer match the reviews
+        self.__dict__.pop('summary_stats', None)
         
         logger.info("Data preparation complete")
     
-    def clean_date(self, date_str):
-        """Clean and convert date string to datetime object.
+    def clean_dates(self, dates):
+        """Clean and convert a Series of date strings to datetime objects.
         
         Args:
-            date_str: Date string to clean
+            dates: Series of raw date strings
             
         Returns:
-            pandas.Timestamp: Cleaned date or NaT if invalid
+            pandas.Series: Cleaned dates, NaT where invalid
         """
-        try:
-            if pd.isna(date_str):
-                return pd.NaT
-            
-            # Remove common prefixes
-            date_str = str(date_str).replace('Reviewed in India on ', '')
-            date_str = re.sub(r'Reviewed in \w+ on ', '', date_str)
-            
-            # Try multiple date formats
-            for fmt in ['%d %B %Y', '%B %d, %Y', '%Y-%m-%d', '%d/%m/%Y', '%d %b %Y']:
-                try:
-                    return pd.to_datetime(date_str, format=fmt)
-                except:
-                    continue
-            
-            return pd.to_datetime(date_str, errors='coerce')
-        except:
-            return pd.NaT
+        # Remove common prefixes
+        dates = dates.astype(str).str.replace(_PREFIX_RE, '', regex=True)
+        
+        # Try each format on the rows still unparsed, in priority order, then
+        # fall back to inference for whatever is left
+        parsed = pd.Series(pd.NaT, index=dates.index, dtype='datetime64[ns]')
+        for fmt in (*_DATE_FORMATS, 'mixed'):
+            missing = parsed.isna()
+            if not missing.any():
+                break
+            parsed.loc[missing] = pd.to_datetime(dates[missing], format=fmt, errors='coerce')
+        
+        return parsed
     
     def get_textblob_sentiment(self, text):
         """Calculate TextBlob sentiment score.
@@ -133,10 +280,7 @@ class ReviewAnalyzer:
         Returns:
             float: Sentiment polarity score (-1 to 1)
         """
-        try:
-            return TextBlob(str(text)).sentiment.polarity
-        except:
-            return 0.0
+        return _textblob_score(text)
     
     def get_vader_sentiment(self, text):
         """Calculate VADER sentiment score.
@@ -147,66 +291,154 @@ class ReviewAnalyzer:
         Returns:
             float: Compound sentiment score (-1 to 1)
         """
-        try:
-            return self.vader.polarity_scores(str(text))['compound']
-        except:
-            return 0.0
+        return _vader_score(text, self.vader)
     
     def generate_all_plots(self):
         """Generate all analysis plots."""
         logger.info("Generating analysis plots")
         
-        # Only generate time-based plots if we have valid dates
-        has_valid_dates = (
-            'date' in self.reviews_df.columns and 
-            self.reviews_df['date'].notna().any()
-        )
+        # Render the independent plots concurrently; each one draws on its own
+        # Figure, so no pyplot global state is shared between threads. Results
+        # are merged in task order, so the plots keep a stable order, and
+        # worker exceptions are raised here
+        with ThreadPoolExecutor(max_workers=PLOT_WORKERS) as executor:
+            results = executor.map(lambda plot_task: render_plot_task(*plot_task), self.plot_tasks())
+            for plots, plotly_html in results:
+                self.plots.update(plots)
+                if plotly_html:
+                    self.plotly_sentiment_comparison_html = plotly_html
+        
+        logger.info(f"Generated {len(self.plots)} plots")
+        return self.plots
+    
+    def plot_tasks(self):
+        """List the independent plot tasks with their pre-aggregated inputs.
+        
+        Tasks name their method instead of holding a bound method and carry
+        everything the plot needs in their args, so they can be sent to worker
+        processes without the reviews.
         
-        # List of plot functions to call
-        plot_functions = [
-            ('ratings distribution', self.add_ratings_distribution_plot),
-            ('sentiment distribution', self.add_sentiment_distribution_plots),
-            ('word cloud', self.add_wordcloud_plot),
-            ('verified purchase analysis', self.add_verified_purchase_analysis_plot),
-            ('rating sentiment heatmap', self.add_rating_sentiment_heatmap_plot)
+        Returns:
+            list: (plot name, method name, args, optional) tuples
+        """
+        # Aggregate the plot inputs once, shared by all the plots below
+        inputs = self.aggregate_plot_inputs()
+        
+        plot_tasks = [
+            ('ratings distribution', 'add_ratings_distribution_plot',
+             (inputs['ratings_count'],), False),
+            ('sentiment distribution', 'add_sentiment_distribution_plots',
+             (inputs['textblob_count'], inputs['vader_count']), False),
+            ('word cloud', 'add_wordcloud_plot', (inputs['word_counts'],), False),
+            ('verified purchase analysis', 'add_verified_purchase_analysis_plot',
+             (inputs['verified_count'],), False),
+            ('rating sentiment heatmap', 'add_rating_sentiment_heatmap_plot',
+             (inputs['pivot_textblob'], inputs['pivot_vader']), False),
+            # Interactive Plotly plots get no placeholder on failure
+            ('plotly sentiment comparison', 'generate_plotly_sentiment_comparison',
+             (inputs['star_ratings'], inputs['textblob_scores'], inputs['vader_scores']), True)
         ]
+        # Only generate time-based plots if we have valid dates
+        if 'monthly' in inputs:
+            plot_tasks.append(('time-based', 'add_time_based_plots', (inputs['monthly'],), True))
+        return plot_tasks
+    
+    def render_plot(self, plot_name, method_name, plot_args, optional=False):
+        """Run one plot task, drawing an error placeholder if it fails.
         
-        # Generate each plot with error handling
-        for plot_name, plot_func in plot_functions:
-            try:
-                logger.info(f"Generating {plot_name} plot")
-                plot_func()
-            except Exception as e:
-                logger.error(f"Error generating {plot_name} plot: {str(e)}")
-                # Create a placeholder for failed plot
-                fig, ax = plt.subplots(figsize=(6, 4))
-                ax.text(0.5, 0.5, f'Error generating {plot_name} plot',
-                        horizontalalignment='center',
-                        verticalalignment='center',
-                        transform=ax.transAxes)
-                ax.axis('off')
-                self.plots[plot_name.title()] = self.save_plot_to_bytes(fig)
-        
-        # Generate interactive Plotly plots
+        Args:
+            plot_name: Plot name used in log and error messages
+            method_name: Name of the method that draws the plot
+            plot_args: Arguments for that method
+            optional: Skip the error placeholder if the plot fails
+        """
+        logger.info(f"Generating {plot_name} plot")
         try:
-            self.generate_plotly_sentiment_comparison()
+            getattr(self, method_name)(*plot_args)
         except Exception as e:
-            logger.error(f"Error generating plotly sentiment comparison: {str(e)}")
+            logger.error(f"Error generating {plot_name} plot: {str(e)}")
+            if optional:
+                return
+            # Create a placeholder for failed plot
+            fig, ax = self._create_figure(figsize=(6, 4))
+            ax.text(0.5, 0.5, f'Error generating {plot_name} plot',
+                    horizontalalignment='center',
+                    verticalalignment='center',
+                    transform=ax.transAxes)
+            ax.axis('off')
+            self.plots[plot_name.title()] = self.save_plot_to_bytes(fig)
+    
+    def aggregate_plot_inputs(self):
+        """Compute the counts, crosstabs and series the plots are drawn from.
+        
+        Returns:
+            dict: Rating, sentiment and verified counts, the rating vs
+                sentiment crosstabs, word counts, the scatter arrays for the
+                Plotly comparison and, when there are valid dates, the
+                monthly aggregates
+        """
+        df = self.reviews_df
+        inputs = {
+            'ratings_count': df['star_rating'].value_counts().sort_index(),
+            'textblob_count': df['textblob_category'].value_counts(sort=False),
+            'vader_count': df['vader_category'].value_counts(sort=False),
+            'verified_count': df['verified'].value_counts(),
+            'pivot_textblob': pd.crosstab(df['star_rating'], df['textblob_category']),
+            'pivot_vader': pd.crosstab(df['star_rating'], df['vader_category']),
+            'word_counts': self._word_counts(),
+            # Nullable Int8 ratings go to Plotly as floats, with NaN for missing
+            'star_ratings': df['star_rating'].to_numpy(dtype='float64', na_value=np.nan),
+            # Plotly serializes arrays as JSON number lists; widening the float32
+            # scores and rounding them keeps each value short (0.6249, not
+            # 0.6248999834060669)
+            'textblob_scores': df['textblob_sentiment'].to_numpy(dtype='float64').round(4),
+            'vader_scores': df['vader_sentiment'].to_numpy(dtype='float64').round(4)
+        }
         
-        # Generate time-based plots if dates are available
-        if has_valid_dates:
-            try:
-                self.add_time_based_plots()
-            except Exception as e:
-                logger.error(f"Error generating time-based plots: {str(e)}")
+        if 'date' in df.columns and df['date'].notna().any():
+            # Aggregate every monthly series in a single resample pass
+            inputs['monthly'] = df[
+                ['date', 'text', 'textblob_sentiment', 'vader_sentiment', 'star_rating']
+            ].set_index('date').resample('M').agg({
+                'text': 'size',
+                'textblob_sentiment': 'mean',
+                'vader_sentiment': 'mean',
+                'star_rating': 'mean'
+            }).rename(columns={'text': 'volume'})
         
-        logger.info(f"Generated {len(self.plots)} plots")
-        return self.plots
+        return inputs
     
-    def add_ratings_distribution_plot(self):
-        """Generate ratings distribution pie chart."""
-        fig, ax = plt.subplots(figsize=(6, 6))
-        ratings_count = self.reviews_df['star_rating'].value_counts().sort_index()
+    def _word_counts(self):
+        """Count the words of all review text for the word cloud.
+        
+        Returns:
+            Counter: Word counts, without stopwords and very short tokens
+        """
+        # Combine all non-empty review text into a single string, straight from
+        # the underlying array rather than via an intermediate str Series
+        text = ' '.join([str(t) for t in self.reviews_df['text'].to_numpy() if t])
+        
+        # Basic text cleaning, lowercasing once up front
+        text = text.lower()
+        # Remove URLs
+        text = _URL_RE.sub('', text)
+        # Remove email addresses
+        text = _EMAIL_RE.sub('', text)
+        # Remove punctuation
+        text = text.translate(_PUNCT_TABLE)
+        
+        # Count words directly, skipping stopwords and very short tokens
+        stop_words = _get_stopwords()
+        return Counter(word for word in text.split()
+                       if len(word) > 2 and word not in stop_words)
+    
+    def add_ratings_distribution_plot(self, ratings_count):
+        """Generate ratings distribution pie chart.
+        
+        Args:
+            ratings_count: Review counts per star rating, sorted by rating
+        """
+        fig, ax = self._create_figure(figsize=(6, 6))
         
         # Define colors from red (1-star) to green (5-star)
         colors = ['#ff4d4d', '#ff9966', '#ffcc00', '#99cc33', '#66cc66']
@@ -216,48 +448,54 @@ class ReviewAnalyzer:
         ax.set_title('Distribution of Star Ratings')
         self.plots['Ratings Distribution'] = self.save_plot_to_bytes(fig)
     
-    def add_sentiment_distribution_plots(self):
-        """Generate sentiment distribution pie charts."""
+    def add_sentiment_distribution_plots(self, textblob_count, vader_count):
+        """Generate sentiment distribution pie charts.
+        
+        Args:
+            textblob_count: Review counts per TextBlob sentiment category
+            vader_count: Review counts per VADER sentiment category
+        """
         # TextBlob sentiment distribution
-        fig, ax = plt.subplots(figsize=(6, 6))
-        textblob_count = self.reviews_df['textblob_category'].value_counts()
-        ax.pie(textblob_count, labels=textblob_count.index,
-               autopct='%1.1f%%', colors=['#66cc66', '#cccccc', '#ff6666'])
+        fig, ax = self._create_figure(figsize=(6, 6))
+        textblob_count = textblob_count[textblob_count > 0]
+        ax.pie(textblob_count, labels=textblob_count.index, autopct='%1.1f%%',
+               colors=[_SENTIMENT_COLORS[c] for c in textblob_count.index])
         ax.set_title('TextBlob Sentiment Distribution')
         self.plots['TextBlob Sentiment Distribution'] = self.save_plot_to_bytes(fig)
         
         # VADER sentiment distribution
-        fig, ax = plt.subplots(figsize=(6, 6))
-        vader_count = self.reviews_df['vader_category'].value_counts()
-        ax.pie(vader_count, labels=vader_count.index,
-               autopct='%1.1f%%', colors=['#66cc66', '#cccccc', '#ff6666'])
+        fig, ax = self._create_figure(figsize=(6, 6))
+        vader_count = vader_count[vader_count > 0]
+        ax.pie(vader_count, labels=vader_count.index, autopct='%1.1f%%',
+               colors=[_SENTIMENT_COLORS[c] for c in vader_count.index])
         ax.set_title('VADER Sentiment Distribution')
         self.plots['VADER Sentiment Distribution'] = self.save_plot_to_bytes(fig)
     
-    def add_time_based_plots(self):
-        """Generate time-based analysis plots."""
+    def add_time_based_plots(self, monthly):
+        """Generate time-based analysis plots.
+        
+        Args:
+            monthly: Monthly review volume and mean sentiment and rating
+        """
         # Monthly Review Volume
         try:
-            monthly_reviews = self.reviews_df.set_index('date').resample('M').size()
+            monthly_reviews = monthly['volume']
             if len(monthly_reviews) > 0:
-                fig, ax = plt.subplots(figsize=(8, 4))
+                fig, ax = self._create_figure(figsize=(8, 4))
                 monthly_reviews.plot(kind='bar', ax=ax)
                 ax.set_title('Monthly Review Volume')
                 ax.set_xlabel('Month')
                 ax.set_ylabel('Number of Reviews')
-                plt.xticks(rotation=45)
+                ax.tick_params(axis='x', labelrotation=45)
                 self.plots['Monthly Review Volume'] = self.save_plot_to_bytes(fig)
         except Exception as e:
             logger.error(f"Error generating monthly review volume plot: {str(e)}")
         
         # Sentiment Trend
         try:
-            monthly_sentiment = self.reviews_df.set_index('date').resample('M').agg({
-                'textblob_sentiment': 'mean',
-                'vader_sentiment': 'mean'
-            })
+            monthly_sentiment = monthly[['textblob_sentiment', 'vader_sentiment']]
             if len(monthly_sentiment) > 0:
-                fig, ax = plt.subplots(figsize=(8, 4))
+                fig, ax = self._create_figure(figsize=(8, 4))
                 ax.plot(monthly_sentiment.index, monthly_sentiment['textblob_sentiment'], label='TextBlob')
                 ax.plot(monthly_sentiment.index, monthly_sentiment['vader_sentiment'], label='VADER')
                 ax.set_title('Average Sentiment Trend Over Time')
@@ -271,11 +509,9 @@ class ReviewAnalyzer:
         
         # Monthly Star Rating
         try:
-            monthly_rating = self.reviews_df.set_index('date').resample('M').agg({
-                'star_rating': 'mean'
-            })
+            monthly_rating = monthly[['star_rating']].astype('float64')
             if len(monthly_rating) > 0:
-                fig, ax = plt.subplots(figsize=(8, 4))
+                fig, ax = self._create_figure(figsize=(8, 4))
                 ax.plot(monthly_rating.index, monthly_rating['star_rating'], 
                        marker='o', linestyle='-', color='orange')
                 ax.set_title('Average Star Rating Over Time')
@@ -287,6 +523,40 @@ class ReviewAnalyzer:
         except Exception as e:
             logger.error(f"Error generating rating trend plot: {str(e)}")
     
+    def _create_figure(self, nrows=1, ncols=1, figsize=None):
+        """Create a standalone figure and its axes, outside of pyplot.
+        
+        Figures are cached per size and per thread, and cleared for reuse, so
+        each plot skips building a new figure and canvas. Plot threads never
+        share a figure.
+        
+        Args:
+            nrows: Number of subplot rows
+            ncols: Number of subplot columns
+            figsize: Figure size in inches
+            
+        Returns:
+            tuple: (Figure, Axes or array of Axes)
+        """
+        from matplotlib.figure import Figure, SubplotParams
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        figures = getattr(_FIGURE_CACHE, 'figures', None)
+        if figures is None:
+            figures = _FIGURE_CACHE.figures = {}
+        
+        fig = figures.get(figsize)
+        if fig is None:
+            fig = figures[figsize] = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+        else:
+            fig.clear()
+            # Drop the layout engine and spacing left behind by tight_layout on
+            # the previous plot, or the next save warns that the layout changed
+            fig.set_layout_engine(None)
+            fig.subplotpars = SubplotParams()
+        return fig, fig.subplots(nrows, ncols)
+    
     def save_plot_to_bytes(self, fig):
         """Save matplotlib figure to bytes.
         
@@ -297,25 +567,35 @@ class ReviewAnalyzer:
             bytes: PNG image data
         """
         buf = io.BytesIO()
-        fig.savefig(buf, format='png', bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
+        # Fit the layout once and render straight to PNG; bbox_inches='tight'
+        # would need an extra draw pass just to measure the bounding box
+        fig.tight_layout()
+        fig.canvas.print_png(buf)
         return buf.getvalue()
     
-    def generate_plotly_sentiment_comparison(self):
-        """Generate interactive Plotly sentiment comparison plot."""
+    def generate_plotly_sentiment_comparison(self, star_ratings, textblob_scores, vader_scores):
+        """Generate interactive Plotly sentiment comparison plot.
+        
+        Args:
+            star_ratings: Star rating per review, NaN where missing
+            textblob_scores: TextBlob sentiment score per review
+            vader_scores: VADER sentiment score per review
+        """
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         fig = make_subplots(rows=1, cols=2)
         
         # Add scatter plot for TextBlob sentiment vs. star rating
         fig.add_trace(
-            go.Scatter(x=self.reviews_df['star_rating'], y=self.reviews_df['textblob_sentiment'],
+            go.Scattergl(x=star_ratings, y=textblob_scores,
                       mode='markers', name='TextBlob', opacity=0.6),
             row=1, col=1
         )
         
         # Add scatter plot for VADER sentiment vs. star rating
         fig.add_trace(
-            go.Scatter(x=self.reviews_df['star_rating'], y=self.reviews_df['vader_sentiment'],
+            go.Scattergl(x=star_ratings, y=vader_scores,
                       mode='markers', name='VADER', opacity=0.6),
             row=1, col=2
         )
@@ -334,43 +614,19 @@ class ReviewAnalyzer:
         
         self.plotly_sentiment_comparison_html = fig.to_html(full_html=False)
     
-    def add_wordcloud_plot(self):
-        """Generate word cloud from review text."""
-        # Combine all review text into a single string
-        text = ' '.join(self.reviews_df['text'].astype(str).fillna(''))
+    def add_wordcloud_plot(self, word_counts):
+        """Generate word cloud from review text.
         
-        # Basic text cleaning
-        text = text.lower()
-        # Remove URLs
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        # Remove punctuation
-        text = re.sub(r'[^\w\s]', '', text)
-        
-        # Remove common stopwords
-        stop_words = set([
-            'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', "you're",
-            "you've", "you'll", "you'd", 'your', 'yours', 'yourself', 'yourselves', 'he',
-            'him', 'his', 'himself', 'she', "she's", 'her', 'hers', 'herself', 'it', "it's",
-            'its', 'itself', 'they', 'them', 'their', 'theirs', 'themselves', 'what', 'which',
-            'who', 'whom', 'this', 'that', "that'll", 'these', 'those', 'am', 'is', 'are',
-            'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'having', 'do',
-            'does', 'did', 'doing', 'a', 'an', 'the', 'and', 'but', 'if', 'or', 'because',
-            'as', 'until', 'while', 'of', 'at', 'by', 'for', 'with', 'about', 'against',
-            'between', 'into', 'through', 'during', 'before', 'after', 'above', 'below',
-            'to', 'from', 'up', 'down', 'in', 'out', 'on', 'off', 'over', 'under', 'again',
-            'further', 'then', 'once'
-        ])
-        
-        # Split into words and remove stopwords
-        words = [word for word in text.split() if word.lower() not in stop_words]
+        Args:
+            word_counts: Word counts of the review text
+        """
+        from wordcloud import WordCloud
         
         # Check if we have any words to plot
-        if not words:
+        if not word_counts:
             logger.warning("No valid words found for word cloud generation")
             # Create a simple message plot instead
-            fig, ax = plt.subplots(figsize=(10, 5))
+            fig, ax = self._create_figure(figsize=(10, 5))
             ax.text(0.5, 0.5, 'No words available for word cloud generation',
                     horizontalalignment='center',
                     verticalalignment='center',
@@ -379,9 +635,6 @@ class ReviewAnalyzer:
             self.plots['Word Cloud'] = self.save_plot_to_bytes(fig)
             return
         
-        # Join words back together
-        processed_text = ' '.join(words)
-        
         try:
             # Generate and plot the word cloud
             wordcloud = WordCloud(
@@ -391,12 +644,11 @@ class ReviewAnalyzer:
                 max_words=100,
                 min_font_size=10,
                 max_font_size=150,
-                random_state=42,  # For reproducibility
-                collocations=False  # Avoid repeating word pairs
-            ).generate(processed_text)
+                random_state=42  # For reproducibility
+            ).generate_from_frequencies(word_counts)
             
             # Create the matplotlib figure
-            fig, ax = plt.subplots(figsize=(10, 5))
+            fig, ax = self._create_figure(figsize=(10, 5))
             ax.imshow(wordcloud, interpolation='bilinear')
             ax.axis('off')
             ax.set_title('Most Common Words in Reviews')
@@ -407,7 +659,7 @@ class ReviewAnalyzer:
         except Exception as e:
             logger.error(f"Error generating word cloud: {str(e)}")
             # Create an error message plot
-            fig, ax = plt.subplots(figsize=(10, 5))
+            fig, ax = self._create_figure(figsize=(10, 5))
             ax.text(0.5, 0.5, 'Error generating word cloud',
                     horizontalalignment='center',
                     verticalalignment='center',
@@ -415,34 +667,36 @@ class ReviewAnalyzer:
             ax.axis('off')
             self.plots['Word Cloud'] = self.save_plot_to_bytes(fig)
     
-    def add_verified_purchase_analysis_plot(self):
-        """Generate verified purchase analysis plot."""
+    def add_verified_purchase_analysis_plot(self, verified_counts):
+        """Generate verified purchase analysis plot.
+        
+        Args:
+            verified_counts: Review counts per verified purchase status
+        """
         # Create a figure for verified vs unverified purchase distribution
-        fig, ax = plt.subplots(figsize=(6, 6))
-        verified_counts = self.reviews_df['verified'].value_counts()
+        fig, ax = self._create_figure(figsize=(6, 6))
         
-        labels = []
-        for value in verified_counts.index:
-            if value is True or value == 1:
-                labels.append('Verified')
-            else:
-                labels.append('Unverified')
+        # verified is a bool column, so the index holds True/False
+        labels = ['Verified' if value else 'Unverified' for value in verified_counts.index]
         
         ax.pie(verified_counts, 
             labels=labels,
             autopct='%1.1f%%',
-            colors=['#66cc66', '#ff6666'])
+            colors=['#66cc66' if value else '#ff6666' for value in verified_counts.index])
         ax.set_title('Verified vs Unverified Purchases')
         self.plots['Verified Purchase Analysis'] = self.save_plot_to_bytes(fig)
     
-    def add_rating_sentiment_heatmap_plot(self):
-        """Generate rating vs sentiment heatmap."""
-        # Create pivot table for ratings vs sentiment categories
-        pivot_textblob = pd.crosstab(self.reviews_df['star_rating'], 
-                                    self.reviews_df['textblob_category'])
+    def add_rating_sentiment_heatmap_plot(self, pivot_textblob, pivot_vader):
+        """Generate rating vs sentiment heatmap.
+        
+        Args:
+            pivot_textblob: Crosstab of star rating vs TextBlob sentiment category
+            pivot_vader: Crosstab of star rating vs VADER sentiment category
+        """
+        import seaborn as sns
         
         # Create heatmap
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+        fig, (ax1, ax2) = self._create_figure(1, 2, figsize=(12, 5))
         
         # TextBlob heatmap
         sns.heatmap(pivot_textblob, annot=True, cmap='YlOrRd', ax=ax1)
@@ -451,14 +705,11 @@ class ReviewAnalyzer:
         ax1.set_ylabel('Star Rating')
         
         # VADER heatmap
-        pivot_vader = pd.crosstab(self.reviews_df['star_rating'], 
-                                self.reviews_df['vader_category'])
         sns.heatmap(pivot_vader, annot=True, cmap='YlOrRd', ax=ax2)
         ax2.set_title('Rating vs VADER Sentiment')
         ax2.set_xlabel('Sentiment Category')
         ax2.set_ylabel('Star Rating')
         
-        plt.tight_layout()
         self.plots['Rating vs Sentiment Heatmap'] = self.save_plot_to_bytes(fig)
     
     def calculate_summary_statistics(self):
@@ -467,6 +718,18 @@ class ReviewAnalyzer:
         Returns:
             pandas.DataFrame: Summary statistics
         """
+        total = len(self.reviews_df)
+        
+        # Aggregate the numeric columns and count sentiment categories in one pass each
+        totals = self.reviews_df.agg({
+            'star_rating': 'mean',
+            'textblob_sentiment': 'mean',
+            'vader_sentiment': 'mean',
+            'verified': 'sum'
+        })
+        textblob_counts = self.reviews_df['textblob_category'].value_counts()
+        vader_counts = self.reviews_df['vader_category'].value_counts()
+        
         # Calculate statistics
         stats = {
             'Metric': [
@@ -481,28 +744,33 @@ class ReviewAnalyzer:
                 'Negative Reviews (VADER)'
             ],
             'Value': [
-                len(self.reviews_df),
-                self.reviews_df['star_rating'].mean(),
-                self.reviews_df['textblob_sentiment'].mean(),
-                self.reviews_df['vader_sentiment'].mean(),
-                (self.reviews_df['verified'].sum() / len(self.reviews_df)) * 100 if len(self.reviews_df) > 0 else 0,
-                (self.reviews_df['textblob_category'] == 'Positive').sum(),
-                (self.reviews_df['textblob_category'] == 'Negative').sum(),
-                (self.reviews_df['vader_category'] == 'Positive').sum(),
-                (self.reviews_df['vader_category'] == 'Negative').sum()
+                total,
+                totals['star_rating'],
+                totals['textblob_sentiment'],
+                totals['vader_sentiment'],
+                (totals['verified'] / total) * 100 if total > 0 else 0,
+                textblob_counts.get('Positive', 0),
+                textblob_counts.get('Negative', 0),
+                vader_counts.get('Positive', 0),
+                vader_counts.get('Negative', 0)
             ]
         }
         
         return pd.DataFrame(stats)
     
-    def export_to_excel_bytes(self):
-        """Export analysis to Excel file as bytes.
+    @functools.cached_property
+    def summary_stats(self):
+        """Summary statistics, computed once after the data is prepared."""
+        return self.calculate_summary_statistics()
+    
+    def _write_workbook(self, target):
+        """Write the analysis workbook to a path or file-like object.
         
-        Returns:
-            bytes: Excel file data
+        Args:
+            target: Output path or writable binary buffer
         """
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        with pd.ExcelWriter(target, engine='xlsxwriter',
+                            engine_kwargs=EXCEL_ENGINE_KWARGS) as writer:
             # Write product info if available
             if self.product_info_df is not None:
                 self.product_info_df.to_excel(writer, sheet_name='Product Info', index=False)
@@ -511,11 +779,17 @@ class ReviewAnalyzer:
             self.reviews_df.to_excel(writer, sheet_name='Reviews', index=False)
             
             # Write summary statistics
-            summary_stats = self.calculate_summary_statistics()
-            summary_stats.to_excel(writer, sheet_name='Summary Statistics', index=False)
+            self.summary_stats.to_excel(writer, sheet_name='Summary Statistics', index=False)
+    
+    def export_to_excel_bytes(self):
+        """Export analysis to Excel file as bytes.
         
-        output.seek(0)
-        return output.read()
+        Returns:
+            bytes: Excel file data
+        """
+        output = io.BytesIO()
+        self._write_workbook(output)
+        return output.getvalue()
     
     def export_to_excel_file(self, filename=None):
         """Export analysis to Excel file.
@@ -537,17 +811,8 @@ class ReviewAnalyzer:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = DATA_DIR / f"amazon_analysis_{timestamp}.xlsx"
         
-        with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
-            # Write product info if available
-            if self.product_info_df is not None:
-                self.product_info_df.to_excel(writer, sheet_name='Product Info', index=False)
-            
-            # Write reviews
-            self.reviews_df.to_excel(writer, sheet_name='Reviews', index=False)
-            
-            # Write summary statistics
-            summary_stats = self.calculate_summary_statistics()
-            summary_stats.to_excel(writer, sheet_name='Summary Statistics', index=False)
+        # Reuse the in-memory export rather than building the workbook twice
+        Path(filename).write_bytes(self.export_to_excel_bytes())
         
         logger.info(f"Excel file saved to {filename}")
         return filename
\ No newline at end of file
@@ -1,18 +1,24 @@
-import os
-import json
+import io
+import time
 import logging
-import pandas as pd
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import streamlit as st
-import time
-import sys
 import traceback
 
 # Import the simple browser setup
-from browser import create_browser, save_cookies, extract_product_id
-from product_scraper import ProductScraper
-from reviews_scraper import ReviewScraper
-from analyzer import ReviewAnalyzer
-from config import DATA_DIR, MAX_PAGES_PER_STAR
+from browser import (
+    get_driver, close_driver, save_cookies, load_cookies, clear_cookies,
+    build_cookie_jar, cdp_cookies, inject_cookies, cookies_valid, extract_product_id
+)
+from config import (
+    MAX_THREADS, MAX_PAGES_PER_STAR, HTTP_CACHE_FILE, HTTP_CACHE_TTL, PLOT_WORKERS,
+    ANALYSIS_POLL_INTERVAL, reviews_snapshot_path
+)
+
+# Scrapers and the analyzer are imported in the handlers that use them, so
+# the UI renders without loading pandas, bs4 or the plotting stack
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +27,311 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def set_login_cookies(cookies):
+    """Store login cookies in session state along with their converted forms.
+    
+    The cookie jar, the CDP cookie list and the namespace that scopes the
+    HTTP caches to this login are built once here instead of on every scrape.
+    
+    Args:
+        cookies: List of cookie dicts saved from the login browser
+    """
+    st.session_state['amazon_cookies'] = cookies
+    st.session_state['amazon_cookie_jar'] = build_cookie_jar(cookies)
+    st.session_state['amazon_cdp_cookies'] = cdp_cookies(cookies)
+    
+    from utils import login_cache_namespace
+    st.session_state['amazon_cache_namespace'] = login_cache_namespace(st.session_state['amazon_cookie_jar'])
+    # The next scrape builds a session around the new cookies
+    st.session_state.pop('http_session', None)
+
+def get_http_session():
+    """Get this user's HTTP session, built once and reused across scrapes.
+    
+    Reusing the session keeps its pooled keep-alive connections to Amazon, so
+    later scrapes skip the TCP and TLS handshakes. It lives in session state
+    rather than st.cache_resource because it carries one user's login cookies.
+    
+    Returns:
+        requests_cache.CachedSession: Session with cookies and browser-like headers set
+    """
+    if 'http_session' not in st.session_state:
+        st.session_state['http_session'] = build_session(
+            st.session_state['amazon_cookie_jar'],
+            st.session_state['amazon_cache_namespace']
+        )
+    return st.session_state['http_session']
+
+def build_session(cookie_jar, cache_namespace):
+    """Create a requests session carrying the Amazon login cookies.
+    
+    Args:
+        cookie_jar: Cookie jar stored by set_login_cookies
+        cache_namespace: Login namespace, so cached pages are only served to this login
+        
+    Returns:
+        requests_cache.CachedSession: Session with cookies and browser-like headers set
+    """
+    import requests_cache
+    from requests.adapters import HTTPAdapter
+    from utils import is_blocked_page
+    
+    # Cache successful pages so repeat scrapes skip the network and the delays;
+    # keys are prefixed with the login so users never get each other's pages
+    session = requests_cache.CachedSession(
+        HTTP_CACHE_FILE,
+        backend='sqlite',
+        expire_after=HTTP_CACHE_TTL,
+        allowable_methods=['GET'],
+        allowable_codes=[200],
+        filter_fn=lambda response: not is_blocked_page(response.content),
+        key_fn=lambda request, **kwargs: f"{cache_namespace}:{requests_cache.create_key(request, **kwargs)}"
+    )
+    session.cookies.update(cookie_jar)
+    
+    # Enough pooled connections for every scraping thread to keep its own
+    adapter = HTTPAdapter(pool_connections=MAX_THREADS, pool_maxsize=MAX_THREADS * 2)
+    session.mount("https://", adapter)
+    
+    # Add a user agent to the session
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Connection": "keep-alive"
+    })
+    return session
+
+def show_product_info(product_info):
+    """Display scraped product information."""
+    st.subheader("Product Information")
+    for key, value in product_info.items():
+        if key != 'about_this_item':
+            st.write(f"**{key.replace('_', ' ').title()}:** {value}")
+    
+    if product_info.get('about_this_item'):
+        st.write("**About This Item:**")
+        for item in product_info['about_this_item']:
+            st.write(f"- {item}")
+
+def show_reviews(reviews_df):
+    """Display review counts by star rating."""
+    st.subheader("Reviews by Star Rating")
+    star_counts = reviews_df['star_rating'].value_counts().sort_index()
+    for star, count in star_counts.items():
+        st.write(f"**{star}★:** {count} reviews")
+
+def load_reviews_snapshot(product_id):
+    """Load reviews the scraper saved for a product in an earlier run.
+    
+    Args:
+        product_id: Amazon product ID
+        
+    Returns:
+        pd.DataFrame: Saved reviews or None if there is no usable snapshot
+    """
+    snapshot_path = reviews_snapshot_path(product_id)
+    if not snapshot_path.exists():
+        return None
+    
+    import pandas as pd
+    try:
+        return pd.read_parquet(snapshot_path)
+    except Exception as e:
+        logger.warning(f"Could not load reviews snapshot: {str(e)}")
+        return None
+
+def reviews_to_csv_bytes(reviews_df):
+    """Encode reviews as CSV straight into a bytes buffer."""
+    buffer = io.BytesIO()
+    reviews_df.to_csv(buffer, index=False, encoding='utf-8')
+    return buffer.getvalue()
+
+def prepared_download(prepare_label, label, make_data, file_name, mime, key):
+    """Offer a download whose data is only built when the user asks for it.
+    
+    The data is produced on demand rather than held in session state across
+    reruns; Streamlit's download_button only accepts ready-made data, so a
+    prepare button comes first.
+    
+    Args:
+        prepare_label: Label of the button that builds the data
+        label: Label of the download button
+        make_data: Callable returning the file contents
+        file_name: Name of the downloaded file
+        mime: MIME type of the file
+        key: Widget key of the download button
+    """
+    if st.button(prepare_label, key=f"prepare-{key}"):
+        st.download_button(label, make_data(), file_name, mime, key=key)
+
+def scrape_product_with_browser(product_scraper, product_url):
+    """Scrape product information in the headless browser.
+    
+    Used when Amazon refuses the plain HTTP request for the product page.
+    
+    Args:
+        product_scraper: ProductScraper instance
+        product_url: Amazon product URL
+        
+    Returns:
+        dict: Product information or None if scraping failed
+    """
+    driver = get_driver(headless=True)
+    if not driver:
+        st.error("Failed to open browser. Make sure ChromeDriver is installed and in your PATH.")
+        return None
+    
+    try:
+        # Add cookies to the browser; they apply on the next page load
+        inject_cookies(driver, st.session_state['amazon_cdp_cookies'])
+        
+        # Navigates to the product page and waits for #productTitle itself
+        return product_scraper.selenium_scrape_product(driver, product_url)
+    except Exception as e:
+        st.error(f"Error during product scraping: {str(e)}")
+        logger.error(traceback.format_exc())
+        return None
+
+@st.cache_resource
+def get_plot_executor():
+    """Get the process pool shared by all sessions for rendering plots."""
+    return ProcessPoolExecutor(max_workers=PLOT_WORKERS)
+
+@st.cache_resource
+def get_analysis_executor():
+    """Get the thread pool shared by all sessions for preparing review data."""
+    return ThreadPoolExecutor(thread_name_prefix="analysis")
+
+def analyze_reviews(reviews_df, product_info):
+    """Prepare reviews for analysis and aggregate their plot inputs.
+    
+    Runs on the analysis thread pool, off the script thread.
+    
+    Args:
+        reviews_df: DataFrame of scraped reviews
+        product_info: Product information dict or None
+        
+    Returns:
+        tuple: (prepared ReviewAnalyzer, list of plot tasks)
+    """
+    from analyzer import ReviewAnalyzer
+    analyzer = ReviewAnalyzer(reviews_df, product_info)
+    analyzer.prepare_data()
+    # Compute the stats here rather than on the rerun that first shows them
+    analyzer.summary_stats
+    return analyzer, analyzer.plot_tasks()
+
+def submit_plot_tasks(plot_tasks, retry=False):
+    """Queue plot tasks on the process pool, replacing the pool if it is broken.
+    
+    Args:
+        plot_tasks: Plot tasks from ReviewAnalyzer.plot_tasks
+        retry: Whether these tasks were already lost to a crashed worker once
+        
+    Returns:
+        list: (plot task, future, retry) tuples
+    """
+    from analyzer import render_plot_task
+    try:
+        executor = get_plot_executor()
+        return [(plot_task, executor.submit(render_plot_task, *plot_task), retry)
+                for plot_task in plot_tasks]
+    except BrokenProcessPool:
+        reset_plot_executor()
+        return submit_plot_tasks(plot_tasks, retry)
+
+def reset_plot_executor():
+    """Drop the shared plot pool after a worker crashed, so the next use builds a new one."""
+    logger.warning("Plot worker process crashed; starting a new pool")
+    get_plot_executor.clear()
+
+def show_plot(slots, name, caption):
+    """Reserve a slot for a plot and show it if it has already been rendered.
+    
+    Args:
+        slots: Dict of plot name to (placeholder, caption), filled in here
+        name: Plot name in the analysis plots dict
+        caption: Caption shown under the image
+    """
+    slot = st.empty()
+    slots[name] = (slot, caption)
+    plot = st.session_state['analysis_plots'].get(name)
+    if plot:
+        slot.image(plot, caption=caption, use_column_width=True)
+
+def show_plotly_comparison(slot, plotly_html):
+    """Show the interactive sentiment comparison in its slot."""
+    with slot.container():
+        st.subheader("Interactive Sentiment Analysis")
+        st.components.v1.html(plotly_html, height=550)
+
+def collect_analysis():
+    """Pick up the background analysis once the data has been prepared.
+    
+    Its plot tasks are then queued on the plot process pool.
+    """
+    future = st.session_state.get('analysis_future')
+    if future is None or not future.done():
+        return
+    del st.session_state['analysis_future']
+    
+    try:
+        analyzer, plot_tasks = future.result()
+    except Exception as e:
+        st.error(f"Error analyzing reviews: {str(e)}")
+        logger.error(traceback.format_exc())
+        return
+    
+    st.session_state['analyzer'] = analyzer
+    st.session_state['analysis_plots'] = {}
+    st.session_state['plot_futures'] = submit_plot_tasks(plot_tasks)
+    st.success("Analysis complete! Visualizations appear below as they finish.")
+
+def collect_finished_plots(slots, plotly_slot):
+    """Fill plot slots for the worker processes that have finished.
+    
+    Never waits: plots still rendering are picked up on a later rerun.
+    Tasks lost to a crashed worker are queued once more on a new pool.
+    
+    Args:
+        slots: Dict of plot name to (placeholder, caption)
+        plotly_slot: Placeholder for the interactive Plotly comparison
+    """
+    pending = []
+    lost = []
+    for plot_task, future, retry in st.session_state.get('plot_futures', []):
+        if not future.done():
+            pending.append((plot_task, future, retry))
+            continue
+        
+        try:
+            plots, plotly_html = future.result()
+        except BrokenProcessPool:
+            if not retry:
+                lost.append(plot_task)
+            else:
+                logger.error(f"Error rendering {plot_task[0]} plot: worker crashed twice")
+            continue
+        except Exception as e:
+            logger.error(f"Error rendering {plot_task[0]} plot: {str(e)}")
+            continue
+        
+        st.session_state['analysis_plots'].update(plots)
+        for name, plot in plots.items():
+            if name in slots:
+                slot, caption = slots[name]
+                slot.image(plot, caption=caption, use_column_width=True)
+        
+        if plotly_html:
+            st.session_state['analyzer'].plotly_sentiment_comparison_html = plotly_html
+            show_plotly_comparison(plotly_slot, plotly_html)
+    
+    if lost:
+        reset_plot_executor()
+        pending.extend(submit_plot_tasks(lost, retry=True))
+    st.session_state['plot_futures'] = pending
+
 def main():
     st.set_page_config(page_title="Amalyze: Amazon Product Review Analyzer", layout="wide")
     
@@ -36,12 +347,16 @@ def main():
         value=3
     )
     
-    # Create data directory if it doesn't exist
-    os.makedirs(DATA_DIR, exist_ok=True)
-    
     # Main content
     product_url = st.text_input("Amazon Product URL:")
     
+    # Reuse the login from a previous run if Amazon still accepts it
+    if 'amazon_cookies' not in st.session_state and 'saved_login_checked' not in st.session_state:
+        st.session_state['saved_login_checked'] = True
+        saved_cookies = load_cookies()
+        if saved_cookies and cookies_valid(build_cookie_jar(saved_cookies)):
+            set_login_cookies(saved_cookies)
+    
     tab1, tab2, tab3 = st.tabs(["Login", "Scrape", "Analyze"])
     
     with tab1:
@@ -66,7 +381,7 @@ def main():
             if st.button("Open Amazon Login Page"):
                 if not st.session_state.browser_open:
                     with st.spinner("Opening Chrome browser... This may take a moment"):
-                        driver = create_browser()
+                        driver = get_driver(headless=False)
                         
                         if driver:
                             st.session_state.driver = driver
@@ -85,29 +400,23 @@ def main():
                         try:
                             # Save cookies after user confirms login
                             cookies = save_cookies(st.session_state.driver)
-                            st.session_state['amazon_cookies'] = cookies
+                            set_login_cookies(cookies)
                             st.success(f"Login confirmed! {len(cookies)} cookies saved.")
                             
                             # Close the browser after getting cookies
-                            st.session_state.driver.quit()
+                            close_driver(st.session_state.driver)
                             st.session_state.driver = None
                             st.session_state.browser_open = False
                         except Exception as e:
                             st.error(f"Error saving cookies: {str(e)}")
-                            try:
-                                st.session_state.driver.quit()
-                            except:
-                                pass
+                            close_driver(st.session_state.driver)
                             st.session_state.driver = None
                             st.session_state.browser_open = False
         
         # Add a way to close the browser if needed
         if st.session_state.browser_open:
             if st.button("Cancel Login / Close Browser"):
-                try:
-                    st.session_state.driver.quit()
-                except:
-                    pass
+                close_driver(st.session_state.driver)
                 st.session_state.driver = None
                 st.session_state.browser_open = False
                 st.info("Browser closed.")
@@ -115,6 +424,12 @@ def main():
         # Show current login status
         if 'amazon_cookies' in st.session_state:
             st.success("✅ You are logged in and ready to scrape.")
+            if st.button("Clear saved login"):
+                clear_cookies()
+                for key in ('amazon_cookies', 'amazon_cookie_jar', 'amazon_cdp_cookies', 'amazon_cache_namespace'):
+                    del st.session_state[key]
+                st.session_state.pop('http_session', None)
+                st.rerun()
         else:
             st.warning("⚠️ Not logged in yet. Please complete the login process.")
     
@@ -128,7 +443,15 @@ def main():
             else:
                 st.write(f"Product ID: {product_id}")
                 
-                col1, col2 = st.columns(2)
+                # Reuse reviews saved by an earlier run unless a fresh scrape is wanted
+                force_rescrape = st.checkbox("Force rescrape", help="Ignore saved reviews and cached pages from earlier scrapes")
+                if 'reviews_df' not in st.session_state and not force_rescrape:
+                    saved_reviews = load_reviews_snapshot(product_id)
+                    if saved_reviews is not None:
+                        st.session_state['reviews_df'] = saved_reviews
+                        st.info(f"Loaded {len(saved_reviews)} previously scraped reviews.")
+                
+                col1, col2, col3 = st.columns(3)
                 
                 with col1:
                     if st.button("Scrape Product Info"):
@@ -136,57 +459,22 @@ def main():
                             st.error("Please log in to Amazon first (Step 1).")
                         else:
                             with st.spinner("Scraping product information..."):
-                                driver = create_browser()
+                                from product_scraper import ProductScraper
+                                session = get_http_session()
+                                product_scraper = ProductScraper(session=session)
                                 
-                                if driver:
-                                    try:
-                                        # Add cookies to the browser
-                                        for cookie in st.session_state['amazon_cookies']:
-                                            try:
-                                                cookie_dict = {k: v for k, v in cookie.items() 
-                                                              if k in ['name', 'value', 'domain', 'path']}
-                                                driver.add_cookie(cookie_dict)
-                                            except Exception as e:
-                                                logger.warning(f"Failed to add cookie: {e}")
-                                        
-                                        # Refresh to apply cookies
-                                        driver.refresh()
-                                        time.sleep(2)  # Wait for cookies to take effect
-                                        
-                                        # Navigate to product page
-                                        driver.get(product_url)
-                                        time.sleep(3)  # Wait for page to load
-                                        
-                                        # Scrape product info
-                                        product_scraper = ProductScraper()
-                                        product_info = product_scraper.selenium_scrape_product(driver, product_url)
-                                        
-                                        if product_info:
-                                            st.session_state['product_info'] = product_info
-                                            st.success("Product information scraped successfully!")
-                                            
-                                            # Display product info
-                                            st.subheader("Product Information")
-                                            for key, value in product_info.items():
-                                                if key != 'about_this_item':
-                                                    st.write(f"**{key.replace('_', ' ').title()}:** {value}")
-                                            
-                                            if product_info.get('about_this_item'):
-                                                st.write("**About This Item:**")
-                                                for item in product_info['about_this_item']:
-                                                    st.write(f"- {item}")
-                                        else:
-                                            st.error("Failed to scrape product information.")
-                                    except Exception as e:
-                                        st.error(f"Error during product scraping: {str(e)}")
-                                        logger.error(traceback.format_exc())
-                                    finally:
-                                        try:
-                                            driver.quit()
-                                        except:
-                                            pass
+                                # Plain HTTP first, the browser only if Amazon refuses it
+                                with session.cache_disabled() if force_rescrape else contextlib.nullcontext():
+                                    product_info = product_scraper.http_scrape_product(product_url)
+                                if product_info is None:
+                                    product_info = scrape_product_with_browser(product_scraper, product_url)
+                                
+                                if product_info:
+                                    st.session_state['product_info'] = product_info
+                                    st.success("Product information scraped successfully!")
+                                    show_product_info(product_info)
                                 else:
-                                    st.error("Failed to open browser. Make sure ChromeDriver is installed and in your PATH.")
+                                    st.error("Failed to scrape product information.")
                 
                 with col2:
                     if st.button("Scrape Reviews"):
@@ -194,50 +482,77 @@ def main():
                             st.error("Please log in to Amazon first (Step 1).")
                         else:
                             with st.spinner(f"Scraping up to {max_pages} pages per star rating..."):
-                                # Create a requests session with cookies
-                                import requests
-                                session = requests.Session()
+                                session = get_http_session()
+                                if force_rescrape:
+                                    st.session_state.pop('reviews_df', None)
                                 
-                                # Convert cookies to requests format
-                                cookies_dict = {}
-                                for cookie in st.session_state['amazon_cookies']:
-                                    cookies_dict[cookie.get('name')] = cookie.get('value')
+                                # Scrape reviews
+                                from reviews_scraper import ReviewScraper
+                                review_scraper = ReviewScraper(
+                                    session=session,
+                                    cache_namespace=st.session_state['amazon_cache_namespace']
+                                )
+                                _, reviews_df = review_scraper.scrape_all(
+                                    product_url,
+                                    max_pages_per_star=max_pages,
+                                    refresh=force_rescrape
+                                )
                                 
-                                session.cookies.update(cookies_dict)
+                                if not reviews_df.empty:
+                                    st.session_state['reviews_df'] = reviews_df
+                                    st.success(f"Successfully scraped {len(reviews_df)} reviews!")
+                                    show_reviews(reviews_df)
+                                else:
+                                    st.error("Failed to scrape reviews or no reviews found.")
+                
+                with col3:
+                    if st.button("Scrape All"):
+                        if 'amazon_cookies' not in st.session_state:
+                            st.error("Please log in to Amazon first (Step 1).")
+                        else:
+                            with st.spinner(f"Scraping product info and up to {max_pages} pages per star rating..."):
+                                session = get_http_session()
+                                if force_rescrape:
+                                    st.session_state.pop('reviews_df', None)
                                 
-                                # Add a user agent to the session
-                                session.headers.update({
-                                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-                                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                                    "Accept-Language": "en-US,en;q=0.9",
-                                    "Connection": "keep-alive"
-                                })
+                                # Product page and review pages share one async client, no browser needed
+                                from product_scraper import ProductScraper
+                                from reviews_scraper import ReviewScraper
+                                review_scraper = ReviewScraper(
+                                    session=session,
+                                    cache_namespace=st.session_state['amazon_cache_namespace']
+                                )
+                                product_info, reviews_df = review_scraper.scrape_all(
+                                    product_url,
+                                    product_scraper=ProductScraper(session=session),
+                                    max_pages_per_star=max_pages,
+                                    refresh=force_rescrape
+                                )
                                 
-                                # Scrape reviews
-                                review_scraper = ReviewScraper(session=session)
-                                reviews_df = review_scraper.scrape_reviews(product_url, max_pages_per_star=max_pages)
+                                if product_info:
+                                    st.session_state['product_info'] = product_info
+                                    show_product_info(product_info)
+                                else:
+                                    st.error("Failed to scrape product information.")
                                 
                                 if not reviews_df.empty:
                                     st.session_state['reviews_df'] = reviews_df
                                     st.success(f"Successfully scraped {len(reviews_df)} reviews!")
-                                    
-                                    # Display review counts by star rating
-                                    st.subheader("Reviews by Star Rating")
-                                    star_counts = reviews_df['star_rating'].value_counts().sort_index()
-                                    for star, count in star_counts.items():
-                                        st.write(f"**{star}★:** {count} reviews")
-                                    
-                                    # Download raw reviews
-                                    reviews_csv = reviews_df.to_csv(index=False).encode('utf-8')
-                                    st.download_button(
-                                        "Download Raw Reviews (CSV)",
-                                        reviews_csv,
-                                        f"{product_id}_reviews.csv",
-                                        "text/csv",
-                                        key='download-csv'
-                                    )
+                                    show_reviews(reviews_df)
                                 else:
                                     st.error("Failed to scrape reviews or no reviews found.")
+                
+                # Download raw reviews
+                if 'reviews_df' in st.session_state:
+                    reviews_df = st.session_state['reviews_df']
+                    prepared_download(
+                        "Prepare Raw Reviews (CSV)",
+                        "Download Raw Reviews (CSV)",
+                        lambda: reviews_to_csv_bytes(reviews_df),
+                        f"{product_id}_reviews.csv",
+                        "text/csv",
+                        key='download-csv'
+                    )
     
     with tab3:
         st.header("Step 3: Analyze Reviews")
@@ -246,31 +561,29 @@ def main():
             st.info("Please scrape reviews first (Step 2).")
         else:
             if st.button("Analyze Reviews"):
-                with st.spinner("Analyzing reviews and generating visualizations..."):
-                    product_info = st.session_state.get('product_info', None)
-                    reviews_df = st.session_state['reviews_df']
-                    
-                    # Analyze reviews
-                    analyzer = ReviewAnalyzer(reviews_df, product_info)
-                    analyzer.prepare_data()
-                    plots = analyzer.generate_all_plots()
-                    excel_bytes = analyzer.export_to_excel_bytes()
-                    
-                    # Store analysis results for display
-                    st.session_state['analysis_plots'] = plots
-                    st.session_state['analysis_excel'] = excel_bytes
-                    st.session_state['analyzer'] = analyzer
-                
-                st.success("Analysis complete!")
+                # Data preparation runs on a background thread and the plots in
+                # worker processes; the page reruns to pick up their results
+                st.session_state['analysis_future'] = get_analysis_executor().submit(
+                    analyze_reviews,
+                    st.session_state['reviews_df'],
+                    st.session_state.get('product_info', None)
+                )
+                for key in ('analyzer', 'analysis_plots', 'plot_futures'):
+                    st.session_state.pop(key, None)
+            
+            collect_analysis()
+            if 'analysis_future' in st.session_state:
+                st.info("Analyzing review sentiment...")
             
             # Display analysis results if available
             if 'analysis_plots' in st.session_state:
                 st.subheader("Analysis Results")
                 
-                # Download Excel with full analysis
-                st.download_button(
+                # Download Excel with full analysis, built only when requested
+                prepared_download(
+                    "Prepare Complete Analysis (Excel)",
                     "Download Complete Analysis (Excel)",
-                    st.session_state['analysis_excel'],
+                    st.session_state['analyzer'].export_to_excel_bytes,
                     "amazon_review_analysis.xlsx",
                     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                     key='download-excel'
@@ -279,7 +592,7 @@ def main():
                 # Display summary statistics
                 if 'analyzer' in st.session_state:
                     st.subheader("Summary Statistics")
-                    stats_df = st.session_state['analyzer'].calculate_summary_statistics()
+                    stats_df = st.session_state['analyzer'].summary_stats
                     
                     # Convert to a more display-friendly format
                     stats_dict = dict(zip(stats_df['Metric'], stats_df['Value']))
@@ -304,102 +617,45 @@ def main():
                     "Verified vs Unverified", "Time Analysis"
                 ])
                 
+                # Each plot gets a slot that is filled now or when its worker finishes
+                slots = {}
+                
                 with viz_tabs[0]:  # Ratings tab
-                    if "Ratings Distribution" in st.session_state['analysis_plots']:
-                        st.image(
-                            st.session_state['analysis_plots']["Ratings Distribution"],
-                            caption="Ratings Distribution",
-                            use_column_width=True
-                        )
-                    
-                    if "Rating vs Sentiment Heatmap" in st.session_state['analysis_plots']:
-                        st.image(
-                            st.session_state['analysis_plots']["Rating vs Sentiment Heatmap"],
-                            caption="Rating vs Sentiment Heatmap",
-                            use_column_width=True
-                        )
+                    show_plot(slots, "Ratings Distribution", "Ratings Distribution")
+                    show_plot(slots, "Rating vs Sentiment Heatmap", "Rating vs Sentiment Heatmap")
                 
                 with viz_tabs[1]:  # Sentiment tab
                     col1, col2 = st.columns(2)
                     
                     with col1:
-                        if "TextBlob Sentiment Distribution" in st.session_state['analysis_plots']:
-                            st.image(
-                                st.session_state['analysis_plots']["TextBlob Sentiment Distribution"],
-                                caption="TextBlob Sentiment Distribution",
-                                use_column_width=True
-                            )
+                        show_plot(slots, "TextBlob Sentiment Distribution", "TextBlob Sentiment Distribution")
                     
                     with col2:
-                        if "VADER Sentiment Distribution" in st.session_state['analysis_plots']:
-                            st.image(
-                                st.session_state['analysis_plots']["VADER Sentiment Distribution"],
-                                caption="VADER Sentiment Distribution",
-                                use_column_width=True
-                            )
+                        show_plot(slots, "VADER Sentiment Distribution", "VADER Sentiment Distribution")
                     
                     # Interactive Plotly visualization
+                    plotly_slot = st.empty()
                     if 'analyzer' in st.session_state and st.session_state['analyzer'].plotly_sentiment_comparison_html:
-                        st.subheader("Interactive Sentiment Analysis")
-                        st.components.v1.html(
-                            st.session_state['analyzer'].plotly_sentiment_comparison_html,
-                            height=550
-                        )
+                        show_plotly_comparison(plotly_slot, st.session_state['analyzer'].plotly_sentiment_comparison_html)
                 
                 with viz_tabs[2]:  # Word Cloud tab
-                    if "Word Cloud" in st.session_state['analysis_plots']:
-                        st.image(
-                            st.session_state['analysis_plots']["Word Cloud"],
-                            caption="Word Cloud of Review Text",
-                            use_column_width=True
-                        )
+                    show_plot(slots, "Word Cloud", "Word Cloud of Review Text")
                 
                 with viz_tabs[3]:  # Verified vs Unverified tab
-                    if "Verified Purchase Analysis" in st.session_state['analysis_plots']:
-                        st.image(
-                            st.session_state['analysis_plots']["Verified Purchase Analysis"],
-                            caption="Verified vs Unverified Purchases",
-                            use_column_width=True
-                        )
+                    show_plot(slots, "Verified Purchase Analysis", "Verified vs Unverified Purchases")
                 
                 with viz_tabs[4]:  # Time Analysis tab
-                    if "Monthly Review Volume" in st.session_state['analysis_plots']:
-                        st.image(
-                            st.session_state['analysis_plots']["Monthly Review Volume"],
-                            caption="Monthly Review Volume",
-                            use_column_width=True
-                        )
-                    
-                    if "Sentiment Trend" in st.session_state['analysis_plots']:
-                        st.image(
-                            st.session_state['analysis_plots']["Sentiment Trend"],
-                            caption="Sentiment Trend Over Time",
-                            use_column_width=True
-                        )
-                    
-                    if "Rating Trend" in st.session_state['analysis_plots']:
-                        st.image(
-                            st.session_state['analysis_plots']["Rating Trend"],
-                            caption="Rating Trend Over Time",
-                            use_column_width=True
-                        )
-
-# Clean up browser before exit
-def cleanup():
-    if hasattr(st.session_state, 'driver') and st.session_state.driver is not None:
-        try:
-            st.session_state.driver.quit()
-        except:
-            pass
-        st.session_state.driver = None
-        st.session_state.browser_open = False
+                    show_plot(slots, "Monthly Review Volume", "Monthly Review Volume")
+                    show_plot(slots, "Sentiment Trend", "Sentiment Trend Over Time")
+                    show_plot(slots, "Rating Trend", "Rating Trend Over Time")
+                
+                collect_finished_plots(slots, plotly_slot)
+    
+    # Background work cannot update the page itself, so rerun until it is done
+    if 'analysis_future' in st.session_state or st.session_state.get('plot_futures'):
+        time.sleep(ANALYSIS_POLL_INTERVAL)
+        st.rerun()
 
 if __name__ == "__main__":
-    # Ensure data directory exists
-    os.makedirs(DATA_DIR, exist_ok=True)
-    
-    try:
-        main()
-    finally:
-        # Ensure browser is closed when app is exited
-        cleanup()
\ No newline at end of file
+    # Browsers are quit when their session is discarded, or at exit by an atexit hook in browser.py
+    main()
\ No newline at end of file
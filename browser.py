@@ -1,21 +1,60 @@
 import os
+import json
+import atexit
 import logging
-import time
+import weakref
+import httpx
+import streamlit as st
+from requests.cookies import RequestsCookieJar
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from config import BASE_URL, ACCOUNT_URL, COOKIES_FILE, TIMEOUT, get_next_user_agent
+from utils import extract_product_id
 
 logger = logging.getLogger(__name__)
 
-def create_browser():
+# Low-memory flags for the headless scraping browser, which nobody looks at
+_HEADLESS_ARGS = (
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+)
+
+# Browsers handed out by get_driver, quit once when the process exits
+_open_drivers = []
+
+# Session state keys of each session's browsers, by headless setting
+_DRIVER_KEYS = {False: '_login_driver', True: '_scraping_driver'}
+
+def create_browser(headless=False):
     """Create a Chrome browser using the locally installed ChromeDriver.
     
+    Args:
+        headless: Run Chrome without a window (for scraping, not login)
+    
     Returns:
         WebDriver: Chrome WebDriver instance or None if failed
     """
     try:
         # Set up Chrome options with minimal settings
         chrome_options = Options()
+        if headless:
+            for arg in _HEADLESS_ARGS:
+                chrome_options.add_argument(arg)
+            # Don't download images at all
+            chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
         
         # Basic options for stability
         chrome_options.add_argument("--start-maximized")
@@ -28,10 +67,18 @@ def create_browser():
 
         # Create Chrome driver 
         driver = webdriver.Chrome(options=chrome_options)
-        time.sleep(5)
         
-        # Navigate to Amazon
-        driver.get("https://www.amazon.in")
+        # The scraping browser goes straight to the page it scrapes
+        if headless:
+            return driver
+        
+        # Navigate to Amazon and wait for the header logo instead of a fixed sleep
+        driver.get(BASE_URL)
+        try:
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "nav-logo-sprites")))
+        except TimeoutException:
+            # Captcha or interstitial pages have no nav logo; carry on with whatever loaded
+            logger.warning("Amazon header did not load; continuing with the current page")
         
         # Add a banner with instructions
         driver.execute_script("""
@@ -57,7 +104,75 @@ def create_browser():
         logger.error(f"Error creating Chrome browser: {e}")
         return None
 
-def save_cookies(driver, filename='cookies.json'):
+def _driver_is_alive(driver):
+    """Check whether a cached browser can still be used."""
+    if driver is None:
+        return False
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+class _SessionDriver:
+    """Holds a session's browser and quits it once the session is discarded."""
+    
+    def __init__(self, driver):
+        self.driver = driver
+        weakref.finalize(self, close_driver, driver)
+
+def get_driver(headless=False):
+    """Get this session's browser, kept open across Streamlit reruns.
+    
+    Each session gets its own browsers, one per headless setting: a visible
+    one for login and a headless one for scraping. They live in session state
+    rather than st.cache_resource because they carry one user's login
+    cookies. A browser that was closed is replaced on the next call.
+    
+    Args:
+        headless: Whether to get the headless scraping browser
+        
+    Returns:
+        WebDriver: Chrome WebDriver instance or None if failed
+    """
+    key = _DRIVER_KEYS[headless]
+    holder = st.session_state.get(key)
+    if holder is not None and _driver_is_alive(holder.driver):
+        return holder.driver
+    
+    driver = create_browser(headless=headless)
+    if not driver:
+        st.session_state.pop(key, None)
+        return None
+    _open_drivers.append(driver)
+    st.session_state[key] = _SessionDriver(driver)
+    return driver
+
+def close_driver(driver):
+    """Quit a browser obtained from get_driver.
+    
+    Browsers that were already closed are skipped, so this is safe to call
+    again when the session is discarded or the app exits.
+    
+    Args:
+        driver: Selenium WebDriver instance
+    """
+    try:
+        _open_drivers.remove(driver)
+    except ValueError:
+        return
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.warning(f"Error closing browser: {e}")
+
+@atexit.register
+def _close_all_drivers():
+    """Quit every browser still open when the app shuts down."""
+    while _open_drivers:
+        close_driver(_open_drivers[-1])
+
+def save_cookies(driver, filename=COOKIES_FILE):
     """Save browser cookies to a file.
     
     Args:
@@ -67,8 +182,6 @@ def save_cookies(driver, filename='cookies.json'):
     Returns:
         list: List of cookie dictionaries
     """
-    import json
-    
     try:
         cookies = driver.get_cookies()
         with open(filename, 'w') as f:
@@ -78,26 +191,109 @@ def save_cookies(driver, filename='cookies.json'):
         logger.error(f"Error saving cookies: {e}")
         return []
 
-def extract_product_id(url):
-    """Extract the Amazon product ID from a URL.
+def load_cookies(filename=COOKIES_FILE):
+    """Load cookies saved by a previous login.
     
     Args:
-        url: Amazon product URL
+        filename: File the cookies were saved to
         
     Returns:
-        str: Product ID or None if not found
+        list: List of cookie dictionaries or None if there are none saved
     """
-    import re
+    try:
+        with open(filename, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def clear_cookies(filename=COOKIES_FILE):
+    """Delete saved login cookies.
+    
+    Args:
+        filename: File the cookies were saved to
+    """
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        pass
+
+def build_cookie_jar(cookies):
+    """Convert browser cookies into a cookie jar for HTTP clients.
     
-    patterns = [
-        r'/dp/([A-Z0-9]{10})',
-        r'/product/([A-Z0-9]{10})',
-        r'/gp/product/([A-Z0-9]{10})'
+    Domain and path are kept, so cookies that share a name on different
+    domains do not overwrite each other.
+    
+    Args:
+        cookies: List of cookie dictionaries
+        
+    Returns:
+        RequestsCookieJar: Jar usable by requests and httpx
+    """
+    jar = RequestsCookieJar()
+    for cookie in cookies:
+        jar.set(
+            cookie.get('name'),
+            cookie.get('value'),
+            domain=cookie.get('domain', ''),
+            path=cookie.get('path', '/')
+        )
+    return jar
+
+def cdp_cookies(cookies):
+    """Convert browser cookies into CDP Network.setCookies parameters.
+    
+    Args:
+        cookies: List of cookie dictionaries
+        
+    Returns:
+        list: List of CookieParam dictionaries
+    """
+    return [
+        {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "domain": cookie.get("domain", ".amazon.in"),
+            "path": cookie.get("path", "/")
+        }
+        for cookie in cookies
     ]
+
+def inject_cookies(driver, cookie_params):
+    """Set all cookies in one DevTools call instead of one add_cookie per cookie.
+    
+    Cookies set through CDP apply to the next navigation without a refresh.
+    Cookies already in the browser are cleared first, so none are left over
+    from an earlier login.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        cookie_params: List of CookieParam dictionaries from cdp_cookies
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookie_params})
+
+def cookies_valid(cookie_jar):
+    """Check whether saved cookies still hold a logged-in Amazon session.
     
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    Requests the account page, which redirects to sign-in when logged out.
+    
+    Args:
+        cookie_jar: Cookie jar built by build_cookie_jar
+        
+    Returns:
+        bool: True if Amazon still accepts the login
+    """
+    try:
+        response = httpx.get(
+            ACCOUNT_URL,
+            cookies=cookie_jar,
+            headers={"User-Agent": get_next_user_agent()},
+            timeout=TIMEOUT,
+            follow_redirects=True
+        )
+    except httpx.HTTPError as e:
+        logger.warning(f"Could not check saved login: {e}")
+        return False
     
-    return None
\ No newline at end of file
+    return response.status_code == 200 and "/ap/signin" not in str(response.url)
\ No newline at end of file
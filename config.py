@@ -1,22 +1,51 @@
 import random
 import os
+import itertools
+import threading
 from pathlib import Path
 
 # Base paths
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
 os.makedirs(DATA_DIR, exist_ok=True)
+COOKIES_FILE = DATA_DIR / "cookies.json"  # Saved Amazon login cookies
+
+def reviews_snapshot_path(product_id):
+    """Path of the parquet snapshot of a product's scraped reviews"""
+    return DATA_DIR / f"{product_id}_reviews.parquet"
 
 # URL patterns
 BASE_URL = "https://www.amazon.in"
+ACCOUNT_URL = BASE_URL + "/gp/css/homepage.html"  # Redirects to sign-in when logged out
 PRODUCT_URL_PATTERN = BASE_URL + "/dp/{product_id}"
-REVIEWS_URL_PATTERN = BASE_URL + "/product-reviews/{product_id}/ref=cm_cr_arp_d_viewopt_sr?ie=UTF8&reviewerType=all_reviews&filterByStar={star_filter}&pageNumber={page}"
+REVIEWS_TEST_URL_PATTERN = BASE_URL + "/product-reviews/{product_id}"  # Access check before scraping
+
+def reviews_url(product_id, star_filter, page):
+    """Build the URL of one page of star-filtered reviews"""
+    return f"{BASE_URL}/product-reviews/{product_id}/ref=cm_cr_arp_d_viewopt_sr?ie=UTF8&reviewerType=all_reviews&filterByStar={star_filter}&pageNumber={page}"
 
 # Scraping settings
 MAX_THREADS = 10  # Maximum number of concurrent threads
 MAX_RETRIES = 3   # Maximum number of retries per request
 TIMEOUT = 15      # Default timeout for requests in seconds
 MAX_PAGES_PER_STAR = 10  # Maximum number of pages to scrape per star rating
+REQUESTS_PER_SECOND = 4  # Global cap on live requests from the async scraper
+
+# HTTP cache settings
+HTTP_CACHE_TTL = 3600  # Seconds a fetched page is reused before refetching
+HTTP_CACHE_FILE = DATA_DIR / "http_cache.sqlite"  # Cache for the requests session
+ASYNC_HTTP_CACHE_DIR = DATA_DIR / "http_cache"     # Cache for the async httpx client
+
+# Analysis settings
+SENTIMENT_WORKERS = os.cpu_count() or 1  # Worker processes for sentiment scoring
+PARALLEL_SENTIMENT_MIN_REVIEWS = 500     # Below this, scoring runs in-process
+PLOT_WORKERS = 5  # Threads used to render plots concurrently
+ANALYSIS_POLL_INTERVAL = 0.5  # Seconds between reruns while analysis runs in the background
+
+# Excel export settings
+# Review text is written as plain strings, not scanned cell by cell for URLs
+# or formulas (which also keeps text starting with "=" from becoming a formula)
+EXCEL_ENGINE_KWARGS = {'options': {'strings_to_urls': False, 'strings_to_formulas': False}}
 
 # Anti-bot settings
 MIN_DELAY = 1.5   # Minimum delay between requests in seconds
@@ -37,27 +66,34 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36",
 ]
 
-def get_random_user_agent():
-    """Get a random user agent from the list"""
-    return random.choice(USER_AGENTS)
+# Deterministic rotation; the lock keeps next() safe under the scraping thread pool
+_user_agent_cycle = itertools.cycle(USER_AGENTS)
+_user_agent_lock = threading.Lock()
+
+def get_next_user_agent():
+    """Get the next user agent in the rotation"""
+    with _user_agent_lock:
+        return next(_user_agent_cycle)
 
 # Star rating filters
-STAR_FILTERS = {
-    5: "five_star",
-    4: "four_star",
-    3: "three_star",
-    2: "two_star",
-    1: "one_star",
-}
+# (star rating, filterByStar value) pairs, in scraping order
+STAR_FILTERS = (
+    (5, "five_star"),
+    (4, "four_star"),
+    (3, "three_star"),
+    (2, "two_star"),
+    (1, "one_star"),
+)
 
 # CSS selectors for product information
+# Every value is a tuple of selectors, tried in order
 PRODUCT_SELECTORS = {
-    "title": "#productTitle",
-    "price": ["#corePrice_feature_div .a-price-whole", ".a-price .a-offscreen", "span.a-price span[aria-hidden='true']"],
-    "brand": ["#bylineInfo", "#bylineInfo_feature_div a", "a#bylineInfo"],
-    "about_items": "#feature-bullets .a-list-item",
-    "total_ratings": "#acrCustomerReviewText",
-    "star_rating": ["span.a-icon-alt", ".a-size-medium.a-color-base"]
+    "title": ("#productTitle",),
+    "price": ("#corePrice_feature_div .a-price-whole", ".a-price .a-offscreen", "span.a-price span[aria-hidden='true']"),
+    "brand": ("#bylineInfo", "#bylineInfo_feature_div a", "a#bylineInfo"),
+    "about_items": ("#feature-bullets .a-list-item",),
+    "total_ratings": ("#acrCustomerReviewText",),
+    "star_rating": ("span.a-icon-alt", ".a-size-medium.a-color-base")
 }
 
 # CSS selectors for review elements
@@ -1,17 +1,87 @@
 import re
 import logging
 import requests
-from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-from config import PRODUCT_URL_PATTERN, PRODUCT_SELECTORS
-from utils import extract_product_id, make_request_with_backoff
+from config import PRODUCT_URL_PATTERN, PRODUCT_SELECTORS, TIMEOUT
+from utils import extract_product_id, make_request_with_backoff, is_blocked_page, get_default_session
 
 logger = logging.getLogger(__name__)
 
+# Number patterns for price, ratings count and star rating text
+_PRICE_RE = re.compile(r'([\d,]+(?:\.\d+)?)')
+_DIGITS_RE = re.compile(r'([\d,]+)')
+_STAR_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+# Product pages are parsed with selectolax's lexbor backend when it is
+# installed, otherwise with BeautifulSoup and lxml
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    
+    def _parse_html(html_content):
+        return LexborHTMLParser(html_content)
+    
+    def _css_first(tree, selector):
+        return tree.css_first(selector)
+    
+    def _css(tree, selector):
+        return tree.css(selector)
+    
+    def _node_text(node):
+        return node.text()
+except ImportError:
+    from bs4 import BeautifulSoup
+    
+    def _parse_html(html_content):
+        return BeautifulSoup(html_content, 'lxml')
+    
+    def _css_first(tree, selector):
+        return tree.select_one(selector)
+    
+    def _css(tree, selector):
+        return tree.select(selector)
+    
+    def _node_text(node):
+        return node.get_text()
+
+def _number_extractor(selectors, pattern):
+    """Build a function that finds a number in the first matching node's text.
+    
+    The selectors are fixed at import, so fields with a single selector get
+    a function without the fall-through loop.
+    
+    Args:
+        selectors: Tuple of CSS selectors, tried in order
+        pattern: Compiled regex whose first group is the number
+        
+    Returns:
+        callable: Function taking a parsed tree and returning the number text or None
+    """
+    if len(selectors) == 1:
+        selector = selectors[0]
+        
+        def extract(tree):
+            node = _css_first(tree, selector)
+            match = pattern.search(_node_text(node)) if node is not None else None
+            return match.group(1) if match else None
+    else:
+        def extract(tree):
+            for selector in selectors:
+                node = _css_first(tree, selector)
+                if node is not None:
+                    match = pattern.search(_node_text(node))
+                    if match:
+                        return match.group(1)
+            return None
+    return extract
+
+_extract_price = _number_extractor(PRODUCT_SELECTORS["price"], _PRICE_RE)
+_extract_total_ratings = _number_extractor(PRODUCT_SELECTORS["total_ratings"], _DIGITS_RE)
+_extract_star_rating = _number_extractor(PRODUCT_SELECTORS["star_rating"], _STAR_RE)
+
 class ProductScraper:
     def __init__(self, session=None):
         """Initialize the product scraper.
@@ -19,7 +89,7 @@ class ProductScraper:
         Args:
             session: Optional requests session with cookies already set
         """
-        self.session = session or requests.Session()
+        self.session = session or get_default_session()
         self.product_info = {}
     
     def scrape_product(self, url):
@@ -43,7 +113,53 @@ class ProductScraper:
             logger.error("Failed to retrieve product page")
             return None
         
-        self.product_info = self._extract_product_info(response.text, product_id)
+        return self.parse_html(response.content, product_id)
+    
+    def http_scrape_product(self, url):
+        """Scrape product information with a single HTTP request, no browser.
+        
+        Unlike scrape_product this does not retry, so callers can fall back to
+        selenium_scrape_product quickly when Amazon serves an error or captcha.
+        
+        Args:
+            url: The full Amazon product URL
+            
+        Returns:
+            dict: Product information or None if the page could not be fetched
+        """
+        product_id = extract_product_id(url)
+        if not product_id:
+            logger.error(f"Invalid product URL: {url}")
+            return None
+        
+        product_url = PRODUCT_URL_PATTERN.format(product_id=product_id)
+        try:
+            response = self.session.get(product_url, timeout=TIMEOUT)
+        except requests.RequestException as e:
+            logger.warning(f"Product page request failed: {e}")
+            return None
+        
+        if response.status_code != 200:
+            logger.warning(f"Product page request failed with status code {response.status_code}")
+            return None
+        
+        if is_blocked_page(response.content):
+            logger.warning("Amazon served a captcha or login wall for the product page")
+            return None
+        
+        return self.parse_html(response.content, product_id)
+    
+    def parse_html(self, html_content, product_id):
+        """Parse product information from an already fetched product page.
+        
+        Args:
+            html_content: HTML content of the product page, raw bytes or str
+            product_id: The Amazon product ID
+            
+        Returns:
+            dict: Product information
+        """
+        self.product_info = self._extract_product_info(html_content, product_id)
         return self.product_info
     
     def _extract_product_info(self, html_content, product_id):
@@ -56,72 +172,61 @@ class ProductScraper:
         Returns:
             dict: Product information
         """
-        soup = BeautifulSoup(html_content, 'lxml')
+        tree = _parse_html(html_content)
         product_info = {"product_id": product_id}
         
         # Extract title
-        title_elem = soup.select_one(PRODUCT_SELECTORS["title"])
-        product_info["title"] = title_elem.get_text().strip() if title_elem else "Not found"
-        
-        # Extract price
-        price = None
-        for price_selector in PRODUCT_SELECTORS["price"]:
-            price_elem = soup.select_one(price_selector)
-            if price_elem:
-                price_text = price_elem.get_text().strip()
-                # Extract numeric price from text
-                price_match = re.search(r'([\d,]+(\.\d+)?)', price_text)
-                if price_match:
-                    price = price_match.group(1)
-                    break
+        product_info["title"] = self._first_text(tree, PRODUCT_SELECTORS["title"], default="Not found")
         
+        # Extract numeric price from text
+        price = _extract_price(tree)
         product_info["price"] = f"₹{price}" if price else "Not found"
         
         # Extract brand
-        brand = None
-        for brand_selector in PRODUCT_SELECTORS["brand"]:
-            brand_elem = soup.select_one(brand_selector)
-            if brand_elem:
-                brand_text = brand_elem.get_text().strip()
-                # Clean up brand text
-                if "Brand:" in brand_text:
-                    brand = brand_text.replace("Brand:", "").strip()
-                else:
-                    brand = brand_text
-                break
+        brand = self._first_text(tree, PRODUCT_SELECTORS["brand"])
+        # Clean up brand text
+        if "Brand:" in brand:
+            brand = brand.replace("Brand:", "").strip()
         
         product_info["brand"] = brand if brand else "Not found"
         
-        # Extract about items
+        # Extract about items from the first selector that matches any
         about_items = []
-        items_elements = soup.select(PRODUCT_SELECTORS["about_items"])
-        about_items = [item.get_text().strip() for item in items_elements if item.get_text().strip()]
+        for items_selector in PRODUCT_SELECTORS["about_items"]:
+            items_elements = _css(tree, items_selector)
+            if items_elements:
+                about_items = [_node_text(item).strip() for item in items_elements if _node_text(item).strip()]
+                break
         product_info["about_this_item"] = about_items
         
         # Extract ratings info
-        ratings_elem = soup.select_one(PRODUCT_SELECTORS["total_ratings"])
-        if ratings_elem:
-            ratings_text = ratings_elem.get_text().strip()
-            ratings_match = re.search(r'([\d,]+)', ratings_text)
-            product_info["total_ratings"] = ratings_match.group(1) if ratings_match else "Not found"
-        else:
-            product_info["total_ratings"] = "Not found"
+        product_info["total_ratings"] = _extract_total_ratings(tree) or "Not found"
         
         # Extract star rating
-        star_rating = None
-        for rating_selector in PRODUCT_SELECTORS["star_rating"]:
-            star_elem = soup.select_one(rating_selector)
-            if star_elem:
-                star_text = star_elem.get_text()
-                star_match = re.search(r'(\d+(\.\d+)?)', star_text)
-                if star_match:
-                    star_rating = star_match.group(1)
-                    break
-        
+        star_rating = _extract_star_rating(tree)
         product_info["star_rating"] = star_rating if star_rating else "Not found"
         
         return product_info
     
+    def _first_text(self, tree, selectors, default=""):
+        """Get the stripped text of the first node with text, trying selectors in order.
+        
+        Args:
+            tree: Parsed HTML tree
+            selectors: Tuple of CSS selectors
+            default: Value returned when no selector matches a node with text
+            
+        Returns:
+            str: Text of the first matching node or default
+        """
+        for selector in selectors:
+            node = _css_first(tree, selector)
+            if node is not None:
+                text = _node_text(node).strip()
+                if text:
+                    return text
+        return default
+    
     def selenium_scrape_product(self, driver, url):
         """Scrape product using Selenium for dynamic content.
         
@@ -139,8 +244,9 @@ class ProductScraper:
         
         driver.get(url)
         try:
+            # A selector group matches as soon as any of the title selectors does
             WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "productTitle"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, ", ".join(PRODUCT_SELECTORS["title"])))
             )
         except TimeoutException:
             logger.error("Timeout waiting for product page to load")
@@ -149,11 +255,16 @@ class ProductScraper:
         product_info = {"product_id": product_id}
         
         # Extract title
-        try:
-            title_element = driver.find_element(By.ID, "productTitle")
-            product_info["title"] = title_element.text.strip()
-        except NoSuchElementException:
-            product_info["title"] = "Not found"
+        title = None
+        for selector in PRODUCT_SELECTORS["title"]:
+            try:
+                title_element = driver.find_element(By.CSS_SELECTOR, selector)
+                title = title_element.text.strip()
+                break
+            except NoSuchElementException:
+                continue
+        
+        product_info["title"] = title if title else "Not found"
         
         # Extract price
         price = None
@@ -161,7 +272,7 @@ class ProductScraper:
             try:
                 price_element = driver.find_element(By.CSS_SELECTOR, selector)
                 price_text = price_element.text.strip()
-                price_match = re.search(r'([\d,]+(\.\d+)?)', price_text)
+                price_match = _PRICE_RE.search(price_text)
                 if price_match:
                     price = price_match.group(1)
                     break
@@ -187,20 +298,27 @@ class ProductScraper:
         product_info["brand"] = brand if brand else "Not found"
         
         # Extract about items
-        try:
-            about_items_elements = driver.find_elements(By.CSS_SELECTOR, PRODUCT_SELECTORS["about_items"])
-            product_info["about_this_item"] = [item.text.strip() for item in about_items_elements if item.text.strip()]
-        except:
-            product_info["about_this_item"] = []
+        product_info["about_this_item"] = []
+        for selector in PRODUCT_SELECTORS["about_items"]:
+            # find_elements returns an empty list rather than raising when nothing matches
+            about_items_elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            if about_items_elements:
+                product_info["about_this_item"] = [item.text.strip() for item in about_items_elements if item.text.strip()]
+                break
         
         # Extract ratings info
-        try:
-            ratings_element = driver.find_element(By.ID, "acrCustomerReviewText")
-            ratings_text = ratings_element.text.strip()
-            ratings_match = re.search(r'([\d,]+)', ratings_text)
-            product_info["total_ratings"] = ratings_match.group(1) if ratings_match else "Not found"
-        except:
-            product_info["total_ratings"] = "Not found"
+        total_ratings = None
+        for selector in PRODUCT_SELECTORS["total_ratings"]:
+            try:
+                ratings_element = driver.find_element(By.CSS_SELECTOR, selector)
+                ratings_match = _DIGITS_RE.search(ratings_element.text.strip())
+                if ratings_match:
+                    total_ratings = ratings_match.group(1)
+                    break
+            except NoSuchElementException:
+                continue
+        
+        product_info["total_ratings"] = total_ratings if total_ratings else "Not found"
         
         # Extract star rating
         star_rating = None
@@ -208,7 +326,7 @@ class ProductScraper:
             try:
                 star_element = driver.find_element(By.CSS_SELECTOR, selector)
                 star_text = star_element.text
-                star_match = re.search(r'(\d+(\.\d+)?)', star_text)
+                star_match = _STAR_RE.search(star_text)
                 if star_match:
                     star_rating = star_match.group(1)
                     break
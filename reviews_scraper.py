@@ -1,42 +1,184 @@
 import re
 import time
 import json
+import random
+import asyncio
 import logging
 import concurrent.futures
+import httpx
+import hishel
+import httpcore
 import pandas as pd
-from bs4 import BeautifulSoup
-from threading import Semaphore
 from datetime import datetime
-from queue import Queue, Empty
 
 from config import (
-    REVIEWS_URL_PATTERN, 
+    PRODUCT_URL_PATTERN,
+    REVIEWS_TEST_URL_PATTERN,
     STAR_FILTERS, 
     MAX_THREADS,
     MAX_PAGES_PER_STAR,
+    REQUESTS_PER_SECOND,
     REVIEW_SELECTORS,
     DATA_DIR,
-    get_random_delay
+    TIMEOUT,
+    HTTP_CACHE_TTL,
+    ASYNC_HTTP_CACHE_DIR,
+    EXCEL_ENGINE_KWARGS,
+    get_random_delay,
+    reviews_url,
+    reviews_snapshot_path
+)
+from utils import (
+    make_request_with_backoff,
+    make_async_request_with_backoff,
+    extract_product_id,
+    is_blocked_page,
+    is_from_cache,
+    http_cache_key,
+    login_cache_namespace,
+    RateLimitedTransport
 )
-from utils import make_request_with_backoff, extract_product_id
 
 logger = logging.getLogger(__name__)
 
+_STAR_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+# Looser selectors for a review title or body without the inner span
+_TITLE_FALLBACK_SELECTOR = "[data-hook='review-title']"
+_TEXT_FALLBACK_SELECTOR = "[data-hook='review-body']"
+
+# Each review field is selected once per page, scoped to the review containers,
+# instead of once per review
+_field_selectors = {field: selector for field, selector in REVIEW_SELECTORS.items() if field != "container"}
+_field_selectors.update(title_fallback=_TITLE_FALLBACK_SELECTOR, text_fallback=_TEXT_FALLBACK_SELECTOR)
+_FIELD_SELECTORS = {
+    field: f"{REVIEW_SELECTORS['container']} {selector}"
+    for field, selector in _field_selectors.items()
+}
+
+# Review pages are parsed with selectolax's lexbor backend when it is
+# installed, otherwise with BeautifulSoup and lxml
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    
+    def _parse_html(html_content):
+        return LexborHTMLParser(html_content)
+    
+    def _select_all(root, selector):
+        return root.css(selector)
+    
+    def _node_key(node):
+        # Node wrappers are rebuilt on every access; the address identifies the node
+        return node.mem_id
+    
+    def _element_text(element):
+        return element.text().strip()
+except ImportError:
+    import threading
+    import soupsieve
+    from bs4 import BeautifulSoup, SoupStrainer
+    from bs4.builder import LXMLTreeBuilder
+    
+    # Only build the review containers; the selector is a single attribute test
+    _attr_match = re.fullmatch(r"\[([\w-]+)='([^']*)'\]", REVIEW_SELECTORS["container"])
+    _REVIEW_STRAINER = SoupStrainer(attrs={_attr_match.group(1): _attr_match.group(2)}) if _attr_match else None
+    
+    # Every selector parse_page uses, compiled once instead of looked up on each call
+    _COMPILED_SELECTORS = {
+        selector: soupsieve.compile(selector)
+        for selector in (REVIEW_SELECTORS["container"], *_FIELD_SELECTORS.values())
+    }
+    
+    # Each scraping thread reuses one lxml tree builder instead of creating one per page
+    _builders = threading.local()
+    
+    def _parse_html(html_content):
+        builder = getattr(_builders, 'builder', None)
+        if builder is None:
+            builder = _builders.builder = LXMLTreeBuilder()
+        return BeautifulSoup(html_content, builder=builder, parse_only=_REVIEW_STRAINER)
+    
+    def _select_all(root, selector):
+        return _COMPILED_SELECTORS[selector].select(root)
+    
+    def _node_key(node):
+        return id(node)
+    
+    def _element_text(element):
+        return element.get_text().strip()
+
+def _first_per_review(root, selector, review_index):
+    """Select a field across the page and keep the first match inside each review.
+    
+    Args:
+        root: Parsed reviews page
+        selector: Field selector scoped to the review containers
+        review_index: Dict of review container key to its position on the page
+        
+    Returns:
+        list: First matching element per review, None where a review has no match
+    """
+    found = [None] * len(review_index)
+    for node in _select_all(root, selector):
+        # Walk up to the enclosing review container
+        ancestor = node.parent
+        while ancestor is not None and _node_key(ancestor) not in review_index:
+            ancestor = ancestor.parent
+        if ancestor is not None:
+            position = review_index[_node_key(ancestor)]
+            if found[position] is None:
+                found[position] = node
+    return found
+
+def _first_text(*elements):
+    """Get the stripped text of the first element that has any.
+    
+    Args:
+        elements: Candidate elements in order of preference, None for missing ones
+        
+    Returns:
+        str: Text of the first element with text, or "" if none has any
+    """
+    for element in elements:
+        if element is not None:
+            text = _element_text(element)
+            if text:
+                return text
+    return ""
+
+# Columns of the reviews CSV, in the order parse_page builds each review
+_REVIEW_FIELDS = ["star_rating", "title", "text", "date", "verified", "author", "extracted_date"]
+
+# Compact column types for the reviews DataFrame; ratings are whole stars
+_REVIEW_DTYPES = {
+    "star_rating": "int8",
+    "title": "string[pyarrow]",
+    "text": "string[pyarrow]",
+    "date": "string[pyarrow]",
+    "verified": "bool",
+    "author": "string[pyarrow]",
+    "extracted_date": "string[pyarrow]",
+}
+
 class ReviewScraper:
-    def __init__(self, session=None, max_threads=MAX_THREADS):
+    def __init__(self, session=None, max_threads=MAX_THREADS, cache_namespace=None):
         """Initialize the review scraper.
         
         Args:
             session: Optional requests session with cookies already set
             max_threads: Maximum number of concurrent threads
+            cache_namespace: Login namespace that scopes the async page cache,
+                derived from the session cookies if not given
         """
         self.session = session
         self.max_threads = max_threads
-        self.semaphore = Semaphore(max_threads)
-        self.reviews_queue = Queue()
+        self.cache_namespace = cache_namespace
+        # Review dicts per scraped (star_rating, page_number) task
+        self.reviews = {}
         self.total_reviews = 0
         self.successful_requests = 0
         self.failed_requests = 0
+        self.http_cache = None
     
     def scrape_reviews(self, product_url, max_pages_per_star=MAX_PAGES_PER_STAR):
         """Scrape reviews for a product using multiple threads.
@@ -61,24 +203,20 @@ class ReviewScraper:
             return pd.DataFrame()
             
         # Test if we can access Amazon with the current session
-        test_url = f"https://www.amazon.in/product-reviews/{product_id}"
+        test_url = REVIEWS_TEST_URL_PATTERN.format(product_id=product_id)
         test_response = make_request_with_backoff(test_url, self.session)
         if test_response is None:
             logger.error("Failed to access Amazon reviews. Login cookies may have expired or be invalid.")
             return pd.DataFrame()
         
         # Check if we're hitting a captcha or login wall
-        if "Sign in to continue" in test_response.text or "Type the characters you see in this image" in test_response.text:
+        if is_blocked_page(test_response.content):
             logger.error("Amazon is requiring login or showing a captcha. Review scraping cannot proceed.")
             return pd.DataFrame()
         
         logger.info("Initial access test passed. Proceeding with review scraping.")
         
-        # List of (star_rating, page_number) pairs to scrape
-        scrape_tasks = []
-        for star_rating in range(5, 0, -1):
-            for page_number in range(1, max_pages_per_star + 1):
-                scrape_tasks.append((star_rating, page_number))
+        scrape_tasks = self._build_scrape_tasks(max_pages_per_star)
         
         # Use thread pool to scrape in parallel
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_threads) as executor:
@@ -87,128 +225,407 @@ class ReviewScraper:
                     self._scrape_single_page, 
                     product_id, 
                     star_rating, 
+                    star_filter, 
                     page_number
                 ): (star_rating, page_number) 
-                for star_rating, page_number in scrape_tasks
+                for star_rating, star_filter, page_number in scrape_tasks
             }
             
             # Process results as they complete
             for future in concurrent.futures.as_completed(future_to_task):
                 star_rating, page_number = future_to_task[future]
                 try:
-                    reviews_count = future.result()
+                    reviews_count = self._store_reviews(star_rating, page_number, future.result())
                     logger.info(f"Completed {star_rating}★, page {page_number}: {reviews_count} reviews")
                 except Exception as e:
                     logger.error(f"Error scraping {star_rating}★, page {page_number}: {str(e)}")
         
-        # Drain the queue to create a DataFrame
-        reviews = []
-        while not self.reviews_queue.empty():
-            try:
-                reviews.append(self.reviews_queue.get(block=False))
-            except Empty:
-                break
+        return self._collect_reviews(product_id)
+    
+    async def scrape_reviews_async(self, product_url, max_pages_per_star=MAX_PAGES_PER_STAR, refresh=False):
+        """Scrape reviews for a product with asyncio and a shared httpx client.
         
-        logger.info(f"Completed scraping: {len(reviews)} reviews collected")
-        logger.info(f"Successful requests: {self.successful_requests}, Failed requests: {self.failed_requests}")
-        
-        # Save reviews to CSV file
-        df = pd.DataFrame(reviews)
-        if not df.empty:
-            # Save intermediate results as a precaution
-            csv_path = DATA_DIR / f"{product_id}_reviews.csv"
-            df.to_csv(csv_path, index=False)
-            logger.info(f"Reviews saved to {csv_path}")
-        else:
-            logger.warning("No reviews were collected. The dataframe is empty.")
+        Pages are queued as (star_rating, star_filter, page_number) tasks and fetched by
+        max_threads consumer tasks over one HTTP/2 connection pool, reusing the
+        cookies and headers of the requests session.
         
+        Args:
+            product_url: The Amazon product URL
+            max_pages_per_star: Maximum number of pages to scrape per star rating
+            refresh: Refetch pages already in the HTTP cache
+            
+        Returns:
+            pandas.DataFrame: DataFrame containing all scraped reviews
+        """
+        _, df = await self.scrape_all_async(product_url, max_pages_per_star=max_pages_per_star, refresh=refresh)
         return df
     
-    def _scrape_single_page(self, product_id, star_rating, page_number):
-        """Scrape a single page of reviews.
+    async def scrape_all_async(self, product_url, product_scraper=None, max_pages_per_star=MAX_PAGES_PER_STAR,
+                               refresh=False):
+        """Fetch the product page and all review pages concurrently.
+        
+        The product page is fetched alongside the review pages on the same
+        client and parsed with product_scraper, so no browser is needed.
+        
+        Args:
+            product_url: The Amazon product URL
+            product_scraper: Optional ProductScraper used to parse the product page
+            max_pages_per_star: Maximum number of pages to scrape per star rating
+            refresh: Refetch pages already in the HTTP cache
+            
+        Returns:
+            tuple: (product info dict or None, DataFrame of scraped reviews)
+        """
+        product_id = extract_product_id(product_url)
+        if not product_id:
+            logger.error(f"Invalid product URL: {product_url}")
+            return None, pd.DataFrame()
+        
+        logger.info(f"Starting async review scraping for product ID: {product_id}")
+        
+        if self.session is None:
+            logger.error("No session provided. Login cookies may be missing.")
+            return None, pd.DataFrame()
+        
+        # HTTP/2 forbids connection-specific headers such as Connection: keep-alive
+        headers = {k: v for k, v in self.session.headers.items() if k.lower() != "connection"}
+        
+        # Pages are cached by login and URL regardless of Amazon's no-cache headers
+        if self.cache_namespace is None:
+            self.cache_namespace = login_cache_namespace(self.session.cookies)
+        self.http_cache = hishel.AsyncFileStorage(base_path=ASYNC_HTTP_CACHE_DIR, ttl=HTTP_CACHE_TTL)
+        controller = hishel.Controller(
+            cacheable_status_codes=[200],
+            force_cache=True,
+            key_generator=self._cache_key
+        )
+        
+        test_url = REVIEWS_TEST_URL_PATTERN.format(product_id=product_id)
+        scrape_tasks = self._build_scrape_tasks(max_pages_per_star)
+        if refresh:
+            # Evict this product's pages so the scrape refetches and re-caches them
+            urls = [test_url, PRODUCT_URL_PATTERN.format(product_id=product_id)]
+            urls.extend(reviews_url(product_id, star_filter, page_number)
+                        for _, star_filter, page_number in scrape_tasks)
+            for url in urls:
+                await self._evict_url_async(url)
+        
+        # One token bucket paces every live request of this scrape
+        transport = RateLimitedTransport(
+            httpx.AsyncHTTPTransport(http2=True, limits=httpx.Limits(max_connections=self.max_threads)),
+            REQUESTS_PER_SECOND
+        )
+        
+        async with hishel.AsyncCacheClient(
+            storage=self.http_cache,
+            controller=controller,
+            transport=transport,
+            headers=headers,
+            cookies=self.session.cookies,
+            timeout=TIMEOUT,
+            follow_redirects=True
+        ) as client:
+            test_response = await make_async_request_with_backoff(test_url, client)
+            if test_response is None:
+                logger.error("Failed to access Amazon reviews. Login cookies may have expired or be invalid.")
+                return None, pd.DataFrame()
+            
+            if is_blocked_page(test_response.content):
+                logger.error("Amazon is requiring login or showing a captcha. Review scraping cannot proceed.")
+                await self._evict_async(test_response)
+                return None, pd.DataFrame()
+            
+            logger.info("Initial access test passed. Proceeding with review scraping.")
+            
+            # Producer: queue every page up front, consumers drain it
+            tasks = asyncio.Queue()
+            for task in scrape_tasks:
+                tasks.put_nowait(task)
+            
+            semaphore = asyncio.Semaphore(self.max_threads)
+            consumers = [
+                self._consume_pages_async(client, semaphore, tasks, product_id)
+                for _ in range(self.max_threads)
+            ]
+            if product_scraper is None:
+                await asyncio.gather(*consumers)
+                product_info = None
+            else:
+                product_info, *_ = await asyncio.gather(
+                    self._scrape_product_async(client, semaphore, product_scraper, product_id),
+                    *consumers
+                )
+        
+        return product_info, self._collect_reviews(product_id)
+    
+    def scrape_all(self, product_url, product_scraper=None, max_pages_per_star=MAX_PAGES_PER_STAR, refresh=False):
+        """Run scrape_all_async to completion from synchronous code.
         
         Args:
+            product_url: The Amazon product URL
+            product_scraper: Optional ProductScraper used to parse the product page
+            max_pages_per_star: Maximum number of pages to scrape per star rating
+            refresh: Refetch pages already in the HTTP cache
+            
+        Returns:
+            tuple: (product info dict or None, DataFrame of scraped reviews)
+        """
+        return asyncio.run(
+            self.scrape_all_async(
+                product_url,
+                product_scraper=product_scraper,
+                max_pages_per_star=max_pages_per_star,
+                refresh=refresh
+            )
+        )
+    
+    async def _scrape_product_async(self, client, semaphore, product_scraper, product_id):
+        """Fetch and parse the product page on the async client.
+        
+        Args:
+            client: httpx.AsyncClient with login cookies set
+            semaphore: asyncio.Semaphore bounding concurrent requests
+            product_scraper: ProductScraper used to parse the page
+            product_id: The Amazon product ID
+            
+        Returns:
+            dict: Product information or None if the page could not be fetched
+        """
+        async with semaphore:
+            url = PRODUCT_URL_PATTERN.format(product_id=product_id)
+            response = await make_async_request_with_backoff(url, client)
+        
+        if not response:
+            logger.error("Failed to retrieve product page")
+            return None
+        
+        return product_scraper.parse_html(response.content, product_id)
+    
+    async def _consume_pages_async(self, client, semaphore, tasks, product_id):
+        """Scrape queued page tasks until the queue is empty.
+        
+        Args:
+            client: httpx.AsyncClient with login cookies set
+            semaphore: asyncio.Semaphore bounding concurrent requests
+            tasks: asyncio.Queue of (star_rating, star_filter, page_number) tasks
+            product_id: The Amazon product ID
+        """
+        while True:
+            try:
+                star_rating, star_filter, page_number = tasks.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            
+            try:
+                page_reviews = await self._scrape_single_page_async(
+                    client, semaphore, product_id, star_rating, star_filter, page_number
+                )
+                reviews_count = self._store_reviews(star_rating, page_number, page_reviews)
+                logger.info(f"Completed {star_rating}★, page {page_number}: {reviews_count} reviews")
+            except Exception as e:
+                logger.error(f"Error scraping {star_rating}★, page {page_number}: {str(e)}")
+    
+    async def _scrape_single_page_async(self, client, semaphore, product_id, star_rating, star_filter, page_number):
+        """Scrape a single page of reviews on the async client.
+        
+        Args:
+            client: httpx.AsyncClient with login cookies set
+            semaphore: asyncio.Semaphore bounding concurrent requests
             product_id: The Amazon product ID
             star_rating: Star rating filter (1-5)
+            star_filter: filterByStar value for that rating
             page_number: Page number to scrape
             
         Returns:
-            int: Number of reviews scraped from this page
+            list: Review dicts scraped from this page, None if the page could not be fetched
         """
-        with self.semaphore:
-            url = REVIEWS_URL_PATTERN.format(
-                product_id=product_id,
-                star_filter=STAR_FILTERS[star_rating],
-                page=page_number
-            )
-            
-            # Longer delay for the first few pages to avoid being detected
-            if page_number <= 2:
-                time.sleep(2.0 + get_random_delay())  # Additional delay for first pages
+        async with semaphore:
+            url = reviews_url(product_id, star_filter, page_number)
             
-            response = make_request_with_backoff(url, self.session)
+            response = await make_async_request_with_backoff(url, client)
             if not response:
-                self.failed_requests += 1
                 logger.warning(f"Failed to get response for {star_rating}★, page {page_number}")
-                return 0
+                return None
             
-            # Check for captcha or login walls
-            if "Sign in to continue" in response.text or "Type the characters you see in this image" in response.text:
+            if is_blocked_page(response.content):
                 logger.error(f"Hit login wall or captcha for {star_rating}★, page {page_number}")
-                self.failed_requests += 1
-                return 0
+                await self._evict_async(response)
+                return None
+            
+            return self.parse_page(response.content, star_rating)
+    
+    def _build_scrape_tasks(self, max_pages_per_star):
+        """List the (star_rating, star_filter, page_number) tasks to scrape, in random order.
+        
+        Only the scraping order is random; _collect_reviews puts the reviews
+        back in star filter and page order.
+        """
+        tasks = [
+            (star_rating, star_filter, page_number)
+            for star_rating, star_filter in STAR_FILTERS
+            for page_number in range(1, max_pages_per_star + 1)
+        ]
+        # Interleave star filters and pages so workers don't all hit one filter at once
+        random.shuffle(tasks)
+        return tasks
+    
+    def _cache_key(self, request, body):
+        """hishel key generator; the key is kept on the request for eviction.
+        
+        hishel hands the key generator an httpcore request sharing the
+        extensions of the httpx request, so the key is readable from the
+        response later.
+        """
+        key = http_cache_key(request, self.cache_namespace)
+        request.extensions["cache_key"] = key
+        return key
+    
+    async def _evict_async(self, response):
+        """Drop a login wall or captcha page from the async cache so it is refetched."""
+        key = response.request.extensions.get("cache_key")
+        if key:
+            await self.http_cache.remove(key)
+    
+    async def _evict_url_async(self, url):
+        """Drop a cached GET of url from the async cache."""
+        await self.http_cache.remove(http_cache_key(httpcore.Request("GET", url), self.cache_namespace))
+    
+    def _store_reviews(self, star_rating, page_number, page_reviews):
+        """Add one page's reviews to the results and count the request.
+        
+        Called only from the thread or event loop collecting finished pages,
+        so neither the results nor the request counters need locking.
+        
+        Args:
+            star_rating: Star rating filter of the page
+            page_number: Page number of the page
+            page_reviews: List of review dicts from a page, None if the page failed
+            
+        Returns:
+            int: Number of reviews stored
+        """
+        if page_reviews is None:
+            self.failed_requests += 1
+            return 0
+        
+        self.successful_requests += 1
+        self.reviews[(star_rating, page_number)] = page_reviews
+        return len(page_reviews)
+    
+    def _collect_reviews(self, product_id):
+        """Turn the collected reviews into a DataFrame and save its parquet snapshot.
+        
+        Args:
+            product_id: The Amazon product ID
+            
+        Returns:
+            pandas.DataFrame: DataFrame containing all scraped reviews
+        """
+        pages, self.reviews = self.reviews, {}
+        
+        # Pages are scraped in random order; lay them out by star filter, as in
+        # STAR_FILTERS, then page number, so the rows come out the same every run
+        reviews = [
+            review
+            for _, page_reviews in sorted(pages.items(), key=lambda item: (-item[0][0], item[0][1]))
+            for review in page_reviews
+        ]
+        
+        logger.info(f"Completed scraping: {len(reviews)} reviews collected")
+        logger.info(f"Successful requests: {self.successful_requests}, Failed requests: {self.failed_requests}")
+        
+        if not reviews:
+            logger.warning("No reviews were collected. The dataframe is empty.")
+            return pd.DataFrame()
+        
+        df = pd.DataFrame.from_records(reviews, columns=_REVIEW_FIELDS).astype(_REVIEW_DTYPES)
+        
+        # Columnar snapshot for reloading; CSV is only produced for the user's download
+        snapshot_path = reviews_snapshot_path(product_id)
+        try:
+            df.to_parquet(snapshot_path, engine='pyarrow', compression='zstd', index=False)
+            logger.info(f"Reviews saved to {snapshot_path}")
+        except Exception as e:
+            logger.warning(f"Could not save reviews snapshot: {str(e)}")
+        
+        return df
+    
+    def _scrape_single_page(self, product_id, star_rating, star_filter, page_number):
+        """Scrape a single page of reviews.
+        
+        Args:
+            product_id: The Amazon product ID
+            star_rating: Star rating filter (1-5)
+            star_filter: filterByStar value for that rating
+            page_number: Page number to scrape
             
-            self.successful_requests += 1
-            return self._extract_reviews_from_page(response.text, star_rating)
+        Returns:
+            list: Review dicts scraped from this page, None if the page could not be fetched
+        """
+        url = reviews_url(product_id, star_filter, page_number)
+        
+        response = make_request_with_backoff(url, self.session)
+        if not response:
+            logger.warning(f"Failed to get response for {star_rating}★, page {page_number}")
+            return None
+        
+        # Check for captcha or login walls
+        if is_blocked_page(response.content):
+            logger.error(f"Hit login wall or captcha for {star_rating}★, page {page_number}")
+            return None
+        
+        # One human-like pause per live page, longer for the first few to avoid being detected
+        if not is_from_cache(response):
+            extra_delay = 2.0 if page_number <= 2 else 0.0
+            time.sleep(get_random_delay() + extra_delay)
+        
+        return self.parse_page(response.content, star_rating)
     
-    def _extract_reviews_from_page(self, html_content, star_rating):
+    def parse_page(self, html_content, star_rating):
         """Extract reviews from a page of HTML content.
         
         Args:
-            html_content: HTML content of the reviews page
+            html_content: HTML content of the reviews page, raw bytes or str
             star_rating: Star rating filter used for this page
             
         Returns:
-            int: Number of reviews extracted
+            list: Review dicts extracted from the page
         """
-        soup = BeautifulSoup(html_content, 'lxml')
-        review_elements = soup.select(REVIEW_SELECTORS["container"])
+        root = _parse_html(html_content)
+        review_elements = _select_all(root, REVIEW_SELECTORS["container"])
         
         if not review_elements:
             logger.warning("No review elements found on page")
-            return 0
+            return []
         
-        count = 0
-        for element in review_elements:
+        # One page-wide query per field, matched back to its review by ancestor
+        review_index = {_node_key(element): position for position, element in enumerate(review_elements)}
+        fields = {
+            field: _first_per_review(root, selector, review_index)
+            for field, selector in _FIELD_SELECTORS.items()
+        }
+        
+        reviews = []
+        for position in range(len(review_elements)):
             try:
-                # Extract review title
-                title_elem = element.select_one(REVIEW_SELECTORS["title"])
-                if not title_elem:
-                    title_elem = element.select_one("[data-hook='review-title']")
-                title = title_elem.get_text().strip() if title_elem else ""
-                
-                # Extract review text
-                text_elem = element.select_one(REVIEW_SELECTORS["text"])
-                if not text_elem:
-                    text_elem = element.select_one("[data-hook='review-body']")
-                text = text_elem.get_text().strip() if text_elem else ""
+                # Extract review title and text, falling back to the looser selectors
+                title = _first_text(fields["title"][position], fields["title_fallback"][position])
+                text = _first_text(fields["text"][position], fields["text_fallback"][position])
                 
                 # Extract review date
-                date_elem = element.select_one(REVIEW_SELECTORS["date"])
-                date_text = date_elem.get_text().strip() if date_elem else ""
+                date_text = _first_text(fields["date"][position])
                 
                 # Extract verified purchase status
-                verified = element.select_one(REVIEW_SELECTORS["verified"]) is not None
+                verified = fields["verified"][position] is not None
                 
                 # Extract author name
-                author_elem = element.select_one(REVIEW_SELECTORS["author"])
-                author = author_elem.get_text().strip() if author_elem else ""
+                author = _first_text(fields["author"][position])
                 
                 # Extract rating (if available in the page)
-                rating_elem = element.select_one(REVIEW_SELECTORS["rating"])
+                rating_elem = fields["rating"][position]
                 if rating_elem:
-                    rating_text = rating_elem.get_text().strip()
-                    rating_match = re.search(r'(\d+(\.\d+)?)', rating_text)
+                    rating_text = _element_text(rating_elem)
+                    rating_match = _STAR_RE.search(rating_text)
                     extracted_rating = float(rating_match.group(1)) if rating_match else star_rating
                 else:
                     extracted_rating = star_rating
@@ -222,15 +639,13 @@ class ReviewScraper:
                     "author": author,
                     "extracted_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 }
-                
-                self.reviews_queue.put(review_data)
-                count += 1
+                reviews.append(review_data)
                 
             except Exception as e:
                 logger.error(f"Error parsing review: {str(e)}")
                 continue
         
-        return count
+        return reviews
     
     def get_reviews_count(self, df):
         """Get review count statistics.
@@ -249,14 +664,15 @@ class ReviewScraper:
         stats["total"] = len(df)
         
         # Reviews by star rating
+        star_counts = df["star_rating"].value_counts()
         for star in range(1, 6):
-            count = len(df[df["star_rating"] == star])
-            stats[f"{star}_star"] = count
+            stats[f"{star}_star"] = int(star_counts.get(star, 0))
         
         # Verified purchase reviews
         if "verified" in df.columns:
-            stats["verified"] = df["verified"].sum()
-            stats["verified_percent"] = (stats["verified"] / stats["total"]) * 100
+            verified = df["verified"].to_numpy()
+            stats["verified"] = int(verified.sum())
+            stats["verified_percent"] = verified.mean() * 100
         
         return stats
     
@@ -285,7 +701,7 @@ class ReviewScraper:
             else:
                 filename = DATA_DIR / f"amazon_reviews_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         
-        with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
+        with pd.ExcelWriter(filename, engine='xlsxwriter', engine_kwargs=EXCEL_ENGINE_KWARGS) as writer:
             # Write product info if available
             if product_info:
                 # Convert to DataFrame
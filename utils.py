@@ -1,9 +1,16 @@
 import re
 import json
 import time
+import asyncio
+import hashlib
+import functools
 import logging
 import random
+from http.cookiejar import DefaultCookiePolicy
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from aiolimiter import AsyncLimiter
 import os
 from bs4 import BeautifulSoup
 from selenium import webdriver
@@ -14,7 +21,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from config import get_random_delay, get_random_user_agent
+from config import BASE_URL, COOKIES_FILE, MAX_THREADS, get_next_user_agent
 
 # Configure logging
 logging.basicConfig(
@@ -23,18 +30,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Matches /dp/ and /product/ product URLs; /gp/product/ ones contain /product/
+_PRODUCT_ID_RE = re.compile(r'/(?:dp|product)/([A-Z0-9]{10})')
+
 def extract_product_id(url):
     """Extract the Amazon product ID from a URL."""
-    patterns = [
-        r'/dp/([A-Z0-9]{10})',
-        r'/product/([A-Z0-9]{10})',
-        r'/gp/product/([A-Z0-9]{10})'
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    # Plain substring checks rule out non-product URLs before the regex runs
+    if '/dp/' not in url and '/product/' not in url:
+        return None
+    match = _PRODUCT_ID_RE.search(url)
+    return match.group(1) if match else None
+
+def _build_default_session():
+    """Create the pooled keep-alive session used when no session is passed in.
+    
+    The session is shared by every caller, so it never stores cookies: an
+    empty allowed_domains list rejects them all, and no caller's Amazon
+    cookies reach another caller's requests.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    # One pooled connection per scraping thread; retries are done by make_request_with_backoff
+    adapter = HTTPAdapter(pool_connections=MAX_THREADS, pool_maxsize=MAX_THREADS * 2, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+_default_session = _build_default_session()
+
+def get_default_session():
+    """Get the process-wide, cookie-less session shared by callers without their own session."""
+    return _default_session
+
+@functools.lru_cache(maxsize=None)
+def _install_chromedriver():
+    """Resolve the ChromeDriver path with webdriver-manager, once per process."""
+    return ChromeDriverManager().install()
+
+def get_chromedriver_path():
+    """Get the ChromeDriver path, skipping webdriver-manager's version check after the first browser."""
+    driver_path = _install_chromedriver()
+    if not os.path.exists(driver_path):
+        # The cached driver was removed from disk; resolve it again
+        _install_chromedriver.cache_clear()
+        driver_path = _install_chromedriver()
+    return driver_path
 
 def setup_browser(headless=False, user_data_dir=None):
     """Setup a Chrome browser instance with appropriate options."""
@@ -46,7 +87,7 @@ def setup_browser(headless=False, user_data_dir=None):
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument(f"--user-agent={get_random_user_agent()}")
+    chrome_options.add_argument(f"--user-agent={get_next_user_agent()}")
     
     # Add user data directory if provided for session persistence
     if user_data_dir:
@@ -59,7 +100,7 @@ def setup_browser(headless=False, user_data_dir=None):
 
     try:
         # Fixed: Use explicit driver path handling to avoid issues with webdriver-manager
-        driver_path = ChromeDriverManager().install()
+        driver_path = get_chromedriver_path()
         
         # Check if the driver exists
         if not os.path.exists(driver_path):
@@ -92,14 +133,14 @@ def setup_browser(headless=False, user_data_dir=None):
             logger.error(f"Fallback initialization also failed: {fallback_error}")
             raise
 
-def save_cookies(driver, filename='cookies.json'):
+def save_cookies(driver, filename=COOKIES_FILE):
     """Save browser cookies to a file."""
     cookies = driver.get_cookies()
     with open(filename, 'w') as f:
         json.dump(cookies, f)
     return cookies
 
-def load_cookies(filename='cookies.json'):
+def load_cookies(filename=COOKIES_FILE):
     """Load cookies from a file."""
     try:
         with open(filename, 'r') as f:
@@ -112,7 +153,7 @@ def apply_cookies_to_browser(driver, cookies):
     if not cookies:
         return False
     
-    driver.get("https://www.amazon.in")
+    driver.get(BASE_URL)
     for cookie in cookies:
         try:
             # Filter out problematic cookie attributes
@@ -139,17 +180,16 @@ def convert_cookies_for_requests(cookies):
 
 def make_request_with_backoff(url, session=None, max_retries=3):
     """Make a request with exponential backoff for retries."""
+    headers = None
     if not session:
-        session = requests.Session()
-        session.headers.update({"User-Agent": get_random_user_agent()})
+        # The shared session has no user agent of its own, so rotate it per request
+        session = get_default_session()
+        headers = {"User-Agent": get_next_user_agent()}
     
     retry = 0
     while retry < max_retries:
         try:
-            # Add a random delay to mimic human behavior
-            time.sleep(get_random_delay())
-            
-            response = session.get(url, timeout=10)
+            response = session.get(url, headers=headers, timeout=10)
             if response.status_code == 200:
                 return response
             
@@ -165,6 +205,106 @@ def make_request_with_backoff(url, session=None, max_retries=3):
     
     return None
 
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that spaces out requests with a shared token bucket.
+    
+    Sits below the cache transport, so only requests that reach the network
+    spend a token.
+    """
+    
+    def __init__(self, transport, requests_per_second):
+        """Wrap a transport with a rate limit.
+        
+        Args:
+            transport: httpx.AsyncBaseTransport that sends the requests
+            requests_per_second: Maximum requests sent per second
+        """
+        self.transport = transport
+        self.limiter = AsyncLimiter(requests_per_second, 1)
+    
+    async def handle_async_request(self, request):
+        await self.limiter.acquire()
+        return await self.transport.handle_async_request(request)
+    
+    async def aclose(self):
+        await self.transport.aclose()
+
+async def make_async_request_with_backoff(url, client, max_retries=3):
+    """Make a request on an httpx.AsyncClient with exponential backoff for retries.
+    
+    Pacing comes from the client's RateLimitedTransport, not a random delay.
+    """
+    retry = 0
+    while retry < max_retries:
+        try:
+            response = await client.get(url)
+            if response.status_code == 200:
+                return response
+            
+            logger.warning(f"Request failed with status code {response.status_code}")
+        except httpx.HTTPError as e:
+            logger.warning(f"Request failed: {e}")
+        
+        # Exponential backoff
+        retry += 1
+        wait_time = 2 ** retry + random.uniform(0, 1)
+        logger.info(f"Retrying in {wait_time:.2f} seconds... (Attempt {retry}/{max_retries})")
+        await asyncio.sleep(wait_time)
+    
+    return None
+
+def is_from_cache(response):
+    """Check whether a requests-cache or hishel response was served from the cache."""
+    if hasattr(response, 'from_cache'):
+        return response.from_cache
+    return getattr(response, 'extensions', {}).get('from_cache', False)
+
+# Text found on Amazon login walls and captcha pages
+_BLOCKED_PAGE_MARKERS = (
+    "Sign in to continue",
+    "Type the characters you see in this image",
+    "Enter the characters you see",
+)
+_BLOCKED_PAGE_MARKERS_BYTES = tuple(marker.encode() for marker in _BLOCKED_PAGE_MARKERS)
+
+def is_blocked_page(html_content):
+    """Check whether a page, as str or raw bytes, is an Amazon login wall or captcha."""
+    markers = _BLOCKED_PAGE_MARKERS_BYTES if isinstance(html_content, bytes) else _BLOCKED_PAGE_MARKERS
+    # Separate substring scans rather than one alternation regex: `in` uses a
+    # fast literal search, while re tries every branch at every position and
+    # is over 20x slower on a full page
+    return any(marker in html_content for marker in markers)
+
+def login_cache_namespace(cookie_jar):
+    """Identify a login, so cached pages are only served back to that login.
+    
+    Args:
+        cookie_jar: Cookie jar holding the login cookies
+        
+    Returns:
+        str: Short hash of the jar's cookies
+    """
+    cookies = sorted((cookie.domain, cookie.path, cookie.name, cookie.value or '') for cookie in cookie_jar)
+    return hashlib.sha256(json.dumps(cookies).encode()).hexdigest()[:16]
+
+def http_cache_key(request, namespace):
+    """Build the hishel cache key for a request, scoped to one login.
+    
+    Storing, evicting and refreshing pages all build their key here from an
+    httpcore request, so a page is always found again under the key it was
+    stored with.
+    
+    Args:
+        request: httpcore.Request, as passed to hishel's key generator
+        namespace: Login namespace from login_cache_namespace
+        
+    Returns:
+        str: Cache key
+    """
+    return hashlib.sha256(
+        b" ".join([namespace.encode(), request.method, request.url.host, request.url.target])
+    ).hexdigest()
+
 def extract_text_from_element(soup, selector, default=""):
     """Extract text from a BeautifulSoup element using a CSS selector."""
     element = soup.select_one(selector)